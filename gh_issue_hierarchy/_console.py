@@ -0,0 +1,20 @@
+"""
+Shared Rich console.
+
+Created on first use so that importing the package (e.g. for `--help`)
+does not load Rich or probe the terminal.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the process-wide Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
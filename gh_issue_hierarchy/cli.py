@@ -6,18 +6,21 @@ Provides commands for creating, validating, and managing issue hierarchy runs.
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .core import IssueCreator
-from .state_manager import StateManager
-from .validator import validate_input_file, ValidationError
+from ._console import get_console
 from .utils import load_config, setup_logging
 
+if TYPE_CHECKING:
+    import sqlite3
 
-console = Console()
+    from .state_manager import StateManager
+
+
+# Heavy modules (rich, core, state_manager, validator) are imported inside the
+# commands that need them so `--help` and `--version` stay fast.
 
 
 @click.group()
@@ -86,6 +89,8 @@ def create(
         gh-issue-hierarchy create --input issues.json --dry-run
         gh-issue-hierarchy create --input issues.json --force
     """
+    from .core import IssueCreator
+
     # Load configuration
     config = load_config(config_file)
 
@@ -141,6 +146,9 @@ def validate(input_file: Path) -> None:
     Examples:
         gh-issue-hierarchy validate --input issues.json
     """
+    from .validator import validate_input_file, ValidationError
+
+    console = get_console()
     schema_file = Path(__file__).parent.parent / "schemas" / "input-schema.json"
 
     try:
@@ -183,6 +191,9 @@ def status(run_id: str, config_file: Path) -> None:
         gh-issue-hierarchy status
         gh-issue-hierarchy status --run-id 20251024_143022
     """
+    from .state_manager import get_state_manager
+
+    console = get_console()
     config = load_config(config_file)
     state_db_path = Path(config["state_db_path"])
 
@@ -190,29 +201,25 @@ def status(run_id: str, config_file: Path) -> None:
         console.print("[yellow]No runs found (database doesn't exist)[/yellow]")
         sys.exit(0)
 
-    state_manager = StateManager(state_db_path)
+    state_manager = get_state_manager(state_db_path)
 
-    try:
-        if run_id:
-            # Show specific run
-            run = state_manager.get_run(run_id)
-            if not run:
-                console.print(f"[red]✗[/red] Run '{run_id}' not found")
-                sys.exit(1)
-
-            _display_run_details(state_manager, run)
+    if run_id:
+        # Show specific run
+        run = state_manager.get_run(run_id)
+        if not run:
+            console.print(f"[red]✗[/red] Run '{run_id}' not found")
+            sys.exit(1)
 
-        else:
-            # Show all runs
-            runs = state_manager.list_all_runs()
-            if not runs:
-                console.print("[yellow]No runs found[/yellow]")
-                sys.exit(0)
+        _display_run_details(state_manager, run)
 
-            _display_runs_table(runs)
+    else:
+        # Show all runs
+        runs = state_manager.list_all_runs()
+        if not runs:
+            console.print("[yellow]No runs found[/yellow]")
+            sys.exit(0)
 
-    finally:
-        state_manager.close()
+        _display_runs_table(runs)
 
 
 @main.command(name="list-runs")
@@ -231,6 +238,9 @@ def list_runs(config_file: Path) -> None:
     Examples:
         gh-issue-hierarchy list-runs
     """
+    from .state_manager import get_state_manager
+
+    console = get_console()
     config = load_config(config_file)
     state_db_path = Path(config["state_db_path"])
 
@@ -238,18 +248,14 @@ def list_runs(config_file: Path) -> None:
         console.print("[yellow]No runs found (database doesn't exist)[/yellow]")
         sys.exit(0)
 
-    state_manager = StateManager(state_db_path)
+    state_manager = get_state_manager(state_db_path)
 
-    try:
-        runs = state_manager.list_all_runs()
-        if not runs:
-            console.print("[yellow]No runs found[/yellow]")
-            sys.exit(0)
-
-        _display_runs_table(runs)
+    runs = state_manager.list_all_runs()
+    if not runs:
+        console.print("[yellow]No runs found[/yellow]")
+        sys.exit(0)
 
-    finally:
-        state_manager.close()
+    _display_runs_table(runs)
 
 
 @main.command()
@@ -286,6 +292,9 @@ def cleanup(run_id: str, delete_issues: bool, config_file: Path) -> None:
         gh-issue-hierarchy cleanup --run-id 20251024_143022
         gh-issue-hierarchy cleanup --run-id 20251024_143022 --delete-issues
     """
+    from .state_manager import get_state_manager
+
+    console = get_console()
     config = load_config(config_file)
     state_db_path = Path(config["state_db_path"])
 
@@ -293,27 +302,26 @@ def cleanup(run_id: str, delete_issues: bool, config_file: Path) -> None:
         console.print("[red]✗[/red] Database doesn't exist")
         sys.exit(1)
 
-    state_manager = StateManager(state_db_path)
+    state_manager = get_state_manager(state_db_path)
 
-    try:
-        run = state_manager.get_run(run_id)
-        if not run:
-            console.print(f"[red]✗[/red] Run '{run_id}' not found")
-            sys.exit(1)
-
-        if delete_issues:
-            console.print("[yellow]⚠[/yellow] Deleting issues from GitHub is not yet implemented")
-            console.print("Only removing from local database")
+    run = state_manager.get_run(run_id)
+    if not run:
+        console.print(f"[red]✗[/red] Run '{run_id}' not found")
+        sys.exit(1)
 
-        state_manager.delete_run(run_id)
-        console.print(f"[green]✓[/green] Run '{run_id}' deleted from database")
+    if delete_issues:
+        console.print("[yellow]⚠[/yellow] Deleting issues from GitHub is not yet implemented")
+        console.print("Only removing from local database")
 
-    finally:
-        state_manager.close()
+    state_manager.delete_run(run_id)
+    console.print(f"[green]✓[/green] Run '{run_id}' deleted from database")
 
 
 def _display_runs_table(runs: list) -> None:
     """Display runs in a table."""
+    from rich.table import Table
+
+    console = get_console()
     table = Table(title="Runs")
     table.add_column("Run ID", style="cyan")
     table.add_column("Repository", style="green")
@@ -345,8 +353,11 @@ def _display_runs_table(runs: list) -> None:
     console.print(table)
 
 
-def _display_run_details(state_manager: StateManager, run: dict) -> None:
+def _display_run_details(state_manager: "StateManager", run: "sqlite3.Row") -> None:
     """Display detailed information about a run."""
+    from rich.table import Table
+
+    console = get_console()
     console.print(f"\n[bold]Run ID:[/bold] {run['run_id']}")
     console.print(f"[bold]Repository:[/bold] {run['repository']}")
     console.print(f"[bold]Status:[/bold] {run['status']}")
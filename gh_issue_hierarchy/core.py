@@ -5,34 +5,102 @@ Coordinates all modules to create hierarchical issues.
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Literal, Optional, List, Set, Tuple
 
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
-from .state_manager import StateManager
+from ._console import get_console
+from .state_manager import StateManager, get_state_manager
 from .github_client import GitHubClient, GitHubClientError
 from .graph import IssueGraph
-from .validator import validate_input_file, ValidationError
-from .fingerprint import generate_fingerprint
+from .validator import load_input_bytes, parse_input, validate_input_data, ValidationError
+from .fingerprint import (
+    generate_fingerprint_many,
+    DEFAULT_FINGERPRINT_ALGORITHM,
+    FINGERPRINT_ALGORITHMS,
+)
 from .interactive import prompt_for_milestone, prompt_for_labels, display_summary_panel
 from .utils import (
-    compute_file_hash,
+    compute_bytes_hash,
     generate_run_id,
     format_duration,
-    apply_defaults,
+    make_defaults_applier,
 )
 
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+# Default number of issues processed concurrently within one hierarchy level;
+# GitHubClient still sends the writes one at a time, spaced out
+DEFAULT_GITHUB_CONCURRENCY = 4
+
+# Minimum seconds between progress description repaints
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+# What _create_issues does with each issue, decided before the loop starts
+PlanAction = Literal["create", "skip_created", "skip_dup", "dry"]
+
+
+@dataclass(slots=True)
+class Issue:
+    """An input issue with defaults applied, as used by the creation loop."""
+
+    id: str
+    title: str
+    body: Optional[str] = None
+    parent_id: Optional[str] = None
+    milestone: Optional[str] = None
+    labels: Tuple[str, ...] = ()
+    assignees: Tuple[str, ...] = ()
+    due_date: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Issue":
+        """Build an Issue from a validated issue dictionary."""
+        return cls(
+            **{
+                **data,
+                "labels": tuple(data.get("labels", ())),
+                "assignees": tuple(data.get("assignees", ())),
+            }
+        )
 
 
 class IssueCreator:
     """Main orchestrator for creating hierarchical issues."""
 
+    __slots__ = (
+        "input_file",
+        "schema_file",
+        "state_db_path",
+        "config",
+        "dry_run",
+        "force",
+        "resume_run_id",
+        "stats",
+        "data",
+        "state_manager",
+        "github_client",
+        "graph",
+        "run_id",
+        "_input_hash",
+        "_issues",
+        "_fingerprints",
+        "_depths",
+        "_last_progress_update",
+        "_created_cache",
+        "_fingerprint_dupes",
+        "_plan",
+        "_duplicate_of",
+        "_pending_records",
+        "_lock",
+    )
+
     def __init__(
         self,
         input_file: Path,
@@ -77,6 +145,22 @@ class IssueCreator:
         self.github_client: Optional[GitHubClient] = None
         self.graph: Optional[IssueGraph] = None
         self.run_id: Optional[str] = None
+        self._input_hash: Optional[str] = None
+
+        # Per-run caches (populated in _build_graph)
+        self._issues: Dict[str, Issue] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._depths: Dict[str, int] = {}
+        self._last_progress_update = 0.0
+        # Values are state db rows or records written this run; both index by column
+        self._created_cache: Dict[str, Any] = {}
+        self._fingerprint_dupes: Dict[str, Any] = {}
+        self._plan: Dict[str, PlanAction] = {}
+        self._duplicate_of: Dict[str, str] = {}
+        self._pending_records: List[Dict[str, Any]] = []
+
+        # Guards stats and pending records while a level is created concurrently
+        self._lock = threading.Lock()
 
     def run(self) -> bool:
         """
@@ -86,10 +170,12 @@ class IssueCreator:
             True if successful, False otherwise
         """
         start_time = time.time()
+        console = get_console()
 
         try:
             # Step 1: Validate input
             console.print("[bold blue]Step 1:[/bold blue] Validating input file...")
+            self._validate_config()
             self._validate_input()
             console.print("[green]✓[/green] Input validation passed\n")
 
@@ -149,20 +235,29 @@ class IssueCreator:
                 self.state_manager.mark_run_complete(self.run_id, "failed")
             return False
 
-        finally:
-            if self.state_manager:
-                self.state_manager.close()
+    def _validate_config(self) -> None:
+        """Check config values that would otherwise fail deep inside the run."""
+        algorithm = self.config.get("fingerprint_algorithm", DEFAULT_FINGERPRINT_ALGORITHM)
+        if algorithm not in FINGERPRINT_ALGORITHMS:
+            raise ValidationError(
+                f"Invalid config: fingerprint_algorithm '{algorithm}' is not supported "
+                f"(allowed: {', '.join(FINGERPRINT_ALGORITHMS)})"
+            )
 
     def _validate_input(self) -> None:
         """Validate input file against schema."""
-        self.data = validate_input_file(self.input_file, self.schema_file)
+        # Read once: the same bytes feed both the run hash and the parser
+        raw = load_input_bytes(self.input_file)
+        self._input_hash = compute_bytes_hash(raw)
+        self.data = validate_input_data(parse_input(raw), self.schema_file)
 
     def _initialize_state(self) -> None:
         """Initialize state manager and determine run ID."""
-        self.state_manager = StateManager(self.state_db_path)
+        # Shared per database file; stays open for later runs in this process
+        self.state_manager = get_state_manager(self.state_db_path)
 
-        # Compute input file hash
-        input_hash = compute_file_hash(self.input_file)
+        # Input file hash was computed while reading the file for validation
+        input_hash = self._input_hash
 
         # Check for existing run
         if self.resume_run_id:
@@ -173,7 +268,7 @@ class IssueCreator:
             if existing_run["status"] == "completed":
                 raise ValidationError(f"Run '{self.resume_run_id}' is already completed")
             self.run_id = self.resume_run_id
-            console.print(f"[yellow]Resuming run: {self.run_id}[/yellow]")
+            get_console().print(f"[yellow]Resuming run: {self.run_id}[/yellow]")
 
         else:
             # Check for existing run with same input hash
@@ -188,7 +283,7 @@ class IssueCreator:
                 elif existing_run["status"] == "in_progress":
                     # Resume incomplete run
                     self.run_id = existing_run["run_id"]
-                    console.print(f"[yellow]Resuming incomplete run: {self.run_id}[/yellow]")
+                    get_console().print(f"[yellow]Resuming incomplete run: {self.run_id}[/yellow]")
                 else:
                     # Create new run
                     self.run_id = generate_run_id()
@@ -217,16 +312,28 @@ class IssueCreator:
             retry_attempts=self.config.get("retry_attempts", 3),
             retry_backoff_seconds=self.config.get("retry_backoff_seconds", 5),
             timeout_seconds=self.config.get("github_api_timeout_seconds", 30),
+            http2=self.config.get("http2", False),
         )
 
     def _validate_resources(self) -> None:
         """Validate that milestones and labels exist, prompt if missing."""
         defaults = self.data.get("defaults", {})
 
-        # Check milestone
         milestone = defaults.get("milestone")
-        if milestone:
-            existing_milestones = [m["title"] for m in self.github_client.get_milestones()]
+        all_labels = set(defaults.get("labels", [])).union(
+            *(issue.get("labels", ()) for issue in self.data["issues"])
+        )
+
+        # Fetch existing milestones and labels concurrently (one RTT each)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            milestones_future = (
+                executor.submit(self.github_client.get_milestones) if milestone else None
+            )
+            labels_future = executor.submit(self.github_client.get_labels) if all_labels else None
+
+        # Check milestone
+        if milestones_future:
+            existing_milestones = {m["title"] for m in milestones_future.result()}
             if milestone not in existing_milestones:
                 result = prompt_for_milestone(self.github_client, milestone)
                 if result:
@@ -235,23 +342,39 @@ class IssueCreator:
                     defaults.pop("milestone", None)
 
         # Check labels
-        all_labels = set(defaults.get("labels", []))
-        for issue in self.data["issues"]:
-            all_labels.update(issue.get("labels", []))
-
-        if all_labels:
-            existing_labels = self.github_client.get_labels()
-            missing_labels = [label for label in all_labels if label not in existing_labels]
+        if labels_future:
+            existing_labels = set(labels_future.result())
+            missing_labels = sorted(all_labels - existing_labels)
 
             if missing_labels:
                 created_labels = prompt_for_labels(self.github_client, missing_labels)
-                # Labels are now created, no need to modify data
+
+                # Drop labels the user chose not to create, once here rather
+                # than letting every issue creation fail on them
+                skipped_labels = set(missing_labels).difference(created_labels)
+                if skipped_labels:
+                    self._drop_labels(skipped_labels)
+
+    def _drop_labels(self, labels: Set[str]) -> None:
+        """
+        Remove labels from the defaults and every issue in the input.
+
+        Args:
+            labels: Label names to remove
+        """
+        defaults = self.data.get("defaults", {})
+        if "labels" in defaults:
+            defaults["labels"] = [label for label in defaults["labels"] if label not in labels]
+
+        for issue in self.data["issues"]:
+            if "labels" in issue:
+                issue["labels"] = [label for label in issue["labels"] if label not in labels]
 
     def _build_graph(self) -> None:
         """Build dependency graph and validate."""
         # Apply defaults to all issues
-        defaults = self.data.get("defaults", {})
-        issues = [apply_defaults(issue, defaults) for issue in self.data["issues"]]
+        apply_defaults = make_defaults_applier(self.data.get("defaults"))
+        issues = [apply_defaults(issue) for issue in self.data["issues"]]
 
         # Build graph
         self.graph = IssueGraph(issues)
@@ -259,119 +382,263 @@ class IssueCreator:
         # Validate references
         self.graph.validate_references()
 
+        # Precompute fingerprints once per issue
+        fingerprints = generate_fingerprint_many(
+            self.data["repository"],
+            ((issue["title"], issue.get("body")) for issue in issues),
+            algorithm=self.config.get("fingerprint_algorithm", DEFAULT_FINGERPRINT_ALGORITHM),
+        )
+        self._fingerprints = dict(zip((issue["id"] for issue in issues), fingerprints))
+
+        # Slotted records for the creation loop
+        self._issues = {issue["id"]: Issue.from_dict(issue) for issue in issues}
+
+        # Depths for progress display, computed in one pass
+        self._depths = self.graph.compute_all_depths()
+
     def _create_issues(self) -> None:
-        """Create issues in topological order."""
-        # Get sorted issue IDs
-        sorted_ids = self.graph.topological_sort()
-
-        # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Creating issues...", total=len(sorted_ids))
-
-            for issue_id in sorted_ids:
-                issue = self.graph.issues[issue_id]
-                self._create_single_issue(issue, progress, task)
-                progress.advance(task)
-
-    def _create_single_issue(
-        self, issue: Dict[str, Any], progress: Progress, task: Any
-    ) -> None:
+        """Create issues level by level, in parallel within each level."""
+        # Group issue IDs by depth; a level only depends on earlier levels
+        levels = self.graph.topological_levels()
+        total = sum(len(level) for level in levels)
+
+        # Load issues already created in this run with one query
+        self._created_cache = {
+            row["local_id"]: row
+            for row in self.state_manager.get_created_issues_for_run(self.run_id)
+        }
+
+        # Check every fingerprint for duplicates up front (unless force)
+        if not self.force and not self.dry_run:
+            self._fingerprint_dupes = self.state_manager.find_by_fingerprints(
+                self._fingerprints.values()
+            )
+
+        # Decide what to do with every issue before touching GitHub
+        self._plan_issues(levels)
+
+        handlers: Dict[PlanAction, Callable[[Issue], None]] = {
+            "create": self._create_single_issue,
+            "skip_created": self._skip_created_issue,
+            "skip_dup": self._skip_duplicate_issue,
+            "dry": self._dry_run_issue,
+        }
+
+        max_workers = max(1, self.config.get("github_concurrency", DEFAULT_GITHUB_CONCURRENCY))
+
+        # Created issues are committed as soon as the main thread sees them
+        # finish, so state lags GitHub by at most the issues still in flight
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=get_console(),
+            ) as progress, ThreadPoolExecutor(max_workers=max_workers) as executor:
+                task = progress.add_task("Creating issues...", total=total)
+
+                def process(issue_id: str) -> None:
+                    issue = self._issues[issue_id]
+                    self._update_progress(progress, task, issue)
+                    handlers[self._plan[issue_id]](issue)
+
+                for level in levels:
+                    # Every parent of this level was created in an earlier one
+                    for _ in executor.map(process, level):
+                        progress.advance(task)
+                        # Records of workers that finished meanwhile share one INSERT
+                        self._flush_records()
+
+                    # Rows must exist before linking updates them
+                    self._flush_records()
+                    if not self.dry_run:
+                        self._link_level(level, executor)
+        finally:
+            # Workers still running at an interrupt have finished by now
+            self._flush_records()
+
+    def _flush_records(self) -> None:
+        """Write and commit the issue records buffered by workers in one bulk insert."""
+        with self._lock:
+            records, self._pending_records = self._pending_records, []
+
+        if records:
+            self.state_manager.record_created_issues(records)
+
+    def _plan_issues(self, levels: List[List[str]]) -> None:
         """
-        Create a single issue and link to parent if needed.
+        Decide the action for every issue in a single pass.
+
+        Issues are planned in creation order, so when two issues in the input
+        share a fingerprint the later one is skipped as a duplicate.
 
         Args:
-            issue: Issue dictionary
-            progress: Rich progress instance
-            task: Progress task
+            levels: Issue IDs grouped by depth
         """
-        issue_id = issue["id"]
-        title = issue["title"]
-
-        # Update progress description
-        depth = self.graph.get_depth(issue_id)
-        indent = "  " * depth
-        progress.update(task, description=f"{indent}Creating: {title[:50]}")
-
-        # Check if already created
-        if not self.dry_run:
-            existing = self.state_manager.get_created_issue(self.run_id, issue_id)
-            if existing:
-                logger.info(f"Skipping already created issue: {issue_id}")
-                self.stats["skipped"] += 1
-                return
-
-        # Check fingerprint for duplicates (unless force)
-        if not self.force and not self.dry_run:
-            fingerprint = generate_fingerprint(
-                self.data["repository"], title, issue.get("body")
-            )
-            duplicate = self.state_manager.find_by_fingerprint(fingerprint)
-            if duplicate:
-                logger.warning(
-                    f"Duplicate detected for '{title}': "
-                    f"#{duplicate['github_issue_number']} (use --force to recreate)"
-                )
-                self.stats["skipped"] += 1
-                return
+        self._plan = {}
+        self._duplicate_of = {}
+        planned_fingerprints: Dict[str, str] = {}
+
+        for level in levels:
+            for issue_id in level:
+                if self.dry_run:
+                    self._plan[issue_id] = "dry"
+                    continue
+
+                if issue_id in self._created_cache:
+                    self._plan[issue_id] = "skip_created"
+                    continue
+
+                if not self.force:
+                    fingerprint = self._fingerprints[issue_id]
+                    duplicate = self._fingerprint_dupes.get(fingerprint)
+                    if duplicate:
+                        self._plan[issue_id] = "skip_dup"
+                        self._duplicate_of[issue_id] = f"#{duplicate['github_issue_number']}"
+                        continue
+                    if fingerprint in planned_fingerprints:
+                        self._plan[issue_id] = "skip_dup"
+                        self._duplicate_of[issue_id] = f"'{planned_fingerprints[fingerprint]}'"
+                        continue
+                    planned_fingerprints[fingerprint] = issue_id
+
+                self._plan[issue_id] = "create"
+
+    def _update_progress(self, progress: Progress, task: Any, issue: Issue) -> None:
+        """Update the progress description, throttled to limit terminal repaints."""
+        now = time.monotonic()
+        if now - self._last_progress_update >= PROGRESS_UPDATE_INTERVAL:
+            self._last_progress_update = now
+            indent = "  " * self._depths.get(issue.id, 0)
+            progress.update(task, description=f"{indent}Creating: {issue.title[:50]}")
+
+    def _skip_created_issue(self, issue: Issue) -> None:
+        """Skip an issue already created earlier in this run."""
+        logger.info(f"Skipping already created issue: {issue.id}")
+        self._count("skipped")
+
+    def _skip_duplicate_issue(self, issue: Issue) -> None:
+        """Skip an issue whose fingerprint matches an existing issue."""
+        logger.warning(
+            f"Duplicate detected for '{issue.title}': "
+            f"{self._duplicate_of[issue.id]} (use --force to recreate)"
+        )
+        self._count("skipped")
+
+    def _dry_run_issue(self, issue: Issue) -> None:
+        """Log the issue that would be created."""
+        logger.info(f"[DRY RUN] Would create: {issue.title}")
+        self._count("created")
 
-        # Dry run - just log
-        if self.dry_run:
-            logger.info(f"[DRY RUN] Would create: {title}")
-            self.stats["created"] += 1
-            return
+    def _create_single_issue(self, issue: Issue) -> None:
+        """
+        Create a single issue and record it.
+
+        Linking to the parent happens afterwards, once per level. Safe to
+        call from worker threads for issues in the same level.
+
+        Args:
+            issue: Issue to create
+        """
+        issue_id = issue.id
+        title = issue.title
 
         # Create issue
         try:
             result = self.github_client.create_issue(
                 title=title,
-                body=issue.get("body"),
-                milestone=issue.get("milestone"),
-                labels=issue.get("labels"),
-                assignees=issue.get("assignees"),
+                body=issue.body,
+                milestone=issue.milestone,
+                labels=list(issue.labels),
+                assignees=list(issue.assignees),
             )
 
             # Record in database
-            fingerprint = generate_fingerprint(
-                self.data["repository"], title, issue.get("body")
-            )
+            record = {
+                "run_id": self.run_id,
+                "local_id": issue_id,
+                "github_issue_number": result["issue_number"],
+                "github_issue_url": result["issue_url"],
+                "github_node_id": result["node_id"],
+                "title": title,
+                "fingerprint": self._fingerprints[issue_id],
+                "parent_id": issue.parent_id,
+                "linked_at": None,
+            }
+            # Buffered and written in bulk by the main thread
+            with self._lock:
+                self._pending_records.append(record)
+            self._created_cache[issue_id] = record
+
+            self._count("created")
 
-            self.state_manager.record_created_issue(
-                run_id=self.run_id,
-                local_id=issue_id,
-                github_issue_number=result["issue_number"],
-                github_issue_url=result["issue_url"],
-                github_node_id=result["node_id"],
-                title=title,
-                fingerprint=fingerprint,
-                parent_id=issue.get("parent_id"),
-            )
+        except Exception as e:
+            logger.error(f"Failed to create issue '{issue_id}': {e}")
+            self._count("failed")
 
-            self.stats["created"] += 1
+    def _link_level(self, level: List[str], executor: ThreadPoolExecutor) -> None:
+        """
+        Link the issues in a level that are created but not yet linked.
 
-            # Link to parent if needed
-            parent_id = issue.get("parent_id")
-            if parent_id:
-                parent = self.state_manager.get_created_issue(self.run_id, parent_id)
-                if parent:
-                    try:
-                        self.github_client.link_sub_issue(
-                            parent["github_node_id"], result["node_id"]
-                        )
-                        self.state_manager.record_link(
-                            self.run_id, issue_id, parent["github_issue_number"]
-                        )
-                        self.stats["linked"] += 1
-                    except Exception as e:
-                        logger.error(f"Failed to link issue '{issue_id}' to parent: {e}")
-                else:
-                    logger.error(f"Parent '{parent_id}' not found for linking")
+        Children are grouped by parent so each parent needs one bulk GraphQL
+        request instead of one per child. Parents are linked concurrently.
 
-        except Exception as e:
-            logger.error(f"Failed to create issue '{issue_id}': {e}")
-            self.stats["failed"] += 1
+        Args:
+            level: Issue IDs of the level just processed
+            executor: Thread pool shared with issue creation
+        """
+        children_by_parent: Dict[str, List[str]] = {}
+
+        for issue_id in level:
+            parent_id = self._issues[issue_id].parent_id
+            if not parent_id:
+                continue
+
+            # Skip failed creations and issues linked by an earlier attempt;
+            # a resumed run picks up issues created but never linked
+            record = self._created_cache.get(issue_id)
+            if not record or record["linked_at"]:
+                continue
+
+            if parent_id not in self._created_cache:
+                logger.error(f"Parent '{parent_id}' not found for linking")
+                continue
+
+            children_by_parent.setdefault(parent_id, []).append(issue_id)
+
+        def link_children(parent_id: str) -> List[Tuple[str, int]]:
+            parent = self._created_cache[parent_id]
+            child_ids = children_by_parent[parent_id]
+            node_ids = [self._created_cache[child_id]["github_node_id"] for child_id in child_ids]
+
+            try:
+                linked = set(
+                    self.github_client.link_sub_issues_bulk(parent["github_node_id"], node_ids)
+                )
+            except Exception as e:
+                logger.error(f"Failed to link children of '{parent_id}': {e}")
+                return []
+
+            links = []
+            for child_id, node_id in zip(child_ids, node_ids):
+                if node_id in linked:
+                    links.append((child_id, parent["github_issue_number"]))
+                else:
+                    logger.error(f"Failed to link issue '{child_id}' to parent")
+            return links
+
+        # One batched UPDATE for the whole level instead of one per child
+        links = [
+            link
+            for parent_links in executor.map(link_children, children_by_parent)
+            for link in parent_links
+        ]
+        self.state_manager.record_links(self.run_id, links)
+        with self._lock:
+            self.stats["linked"] += len(links)
+
+    def _count(self, stat: str) -> None:
+        """Increment a statistic (thread-safe)."""
+        with self._lock:
+            self.stats[stat] += 1
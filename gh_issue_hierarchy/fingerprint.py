@@ -1,19 +1,89 @@
 """
 Fingerprint generation for issue deduplication.
 
-Creates SHA256 hashes from repository + title + body preview
+Creates BLAKE2b-128 (or SHA256) hashes from repository + title + body preview
 to detect duplicate issues across runs.
 """
 
 import hashlib
-from typing import Optional
+import re
+from typing import Iterable, List, Optional, Tuple
 
 
-def generate_fingerprint(repository: str, title: str, body: Optional[str] = None) -> str:
+# Length of the body prefix included in the fingerprint
+BODY_PREVIEW_CHARS = 100
+
+# Supported fingerprint algorithms. The fingerprint is only used for local
+# duplicate detection, so the shorter, faster BLAKE2b-128 is the default;
+# SHA256 matches fingerprints recorded by older versions.
+FINGERPRINT_ALGORITHMS = ("blake2b", "sha256")
+DEFAULT_FINGERPRINT_ALGORITHM = "blake2b"
+
+_LEADING_WHITESPACE = re.compile(r"\s*")
+_TRAILING_WHITESPACE = re.compile(r"\s*\Z")
+
+
+def _body_preview(body: Optional[str]) -> str:
+    """
+    Return ``body.strip()[:100]`` without copying the whole body.
+
+    Args:
+        body: Issue body/description (optional)
+
+    Returns:
+        First 100 characters of the stripped body
+    """
+    if not body:
+        return ""
+
+    start = _LEADING_WHITESPACE.match(body).end()
+    end = start + BODY_PREVIEW_CHARS
+    preview = body[start:end]
+
+    # Trailing whitespace only matters when nothing but whitespace follows
+    if _TRAILING_WHITESPACE.match(body, end):
+        preview = preview.rstrip()
+
+    return preview
+
+
+def _new_hash(algorithm: str, data: bytes) -> "hashlib._Hash":
+    """
+    Create a hash object for the given fingerprint algorithm.
+
+    Raises:
+        ValueError: If the algorithm is not supported
+    """
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=16)
+    if algorithm == "sha256":
+        return hashlib.sha256(data)
+    raise ValueError(
+        f"Unsupported fingerprint algorithm '{algorithm}' "
+        f"(expected one of: {', '.join(FINGERPRINT_ALGORITHMS)})"
+    )
+
+
+def _hash_parts(repo_bytes: bytes, title: str, body: Optional[str], algorithm: str) -> str:
+    """Hash the fingerprint parts incrementally, without a composite string."""
+    hash_object = _new_hash(algorithm, repo_bytes)
+    hash_object.update(b"|")
+    hash_object.update(title.strip().encode('utf-8'))
+    hash_object.update(b"|")
+    hash_object.update(_body_preview(body).encode('utf-8'))
+    return hash_object.hexdigest()
+
+
+def generate_fingerprint(
+    repository: str,
+    title: str,
+    body: Optional[str] = None,
+    algorithm: str = DEFAULT_FINGERPRINT_ALGORITHM,
+) -> str:
     """
     Generate a fingerprint for an issue to detect duplicates.
 
-    The fingerprint is a SHA256 hash of:
+    The fingerprint is a hash of:
     - Repository name
     - Issue title
     - First 100 characters of the body (if present)
@@ -22,28 +92,37 @@ def generate_fingerprint(repository: str, title: str, body: Optional[str] = None
         repository: GitHub repository in format 'owner/repo'
         title: Issue title
         body: Issue body/description (optional)
+        algorithm: 'blake2b' (default) or 'sha256'
 
     Returns:
-        Hexadecimal SHA256 hash string (64 characters)
+        Hexadecimal hash string (32 characters for blake2b, 64 for sha256)
 
     Example:
         >>> fingerprint = generate_fingerprint("owner/repo", "Bug fix", "Description here")
         >>> len(fingerprint)
-        64
+        32
     """
-    # Normalize inputs
-    repo_normalized = repository.strip().lower()
-    title_normalized = title.strip()
+    repo_bytes = repository.strip().lower().encode('utf-8')
+    return _hash_parts(repo_bytes, title, body, algorithm)
 
-    # Use first 100 chars of body for fingerprint (or empty string if None)
-    body_preview = ""
-    if body:
-        body_preview = body.strip()[:100]
 
-    # Create composite string
-    composite = f"{repo_normalized}|{title_normalized}|{body_preview}"
+def generate_fingerprint_many(
+    repository: str,
+    issues: Iterable[Tuple[str, Optional[str]]],
+    algorithm: str = DEFAULT_FINGERPRINT_ALGORITHM,
+) -> List[str]:
+    """
+    Generate fingerprints for many issues in the same repository.
 
-    # Generate SHA256 hash
-    hash_object = hashlib.sha256(composite.encode('utf-8'))
+    Normalizes and encodes the repository name once for the whole batch.
 
-    return hash_object.hexdigest()
+    Args:
+        repository: GitHub repository in format 'owner/repo'
+        issues: (title, body) pairs
+        algorithm: 'blake2b' (default) or 'sha256'
+
+    Returns:
+        Fingerprints in the same order as the input pairs
+    """
+    repo_bytes = repository.strip().lower().encode('utf-8')
+    return [_hash_parts(repo_bytes, title, body, algorithm) for title, body in issues]
@@ -1,21 +1,77 @@
 """
 GitHub operations wrapper.
 
-Handles issue creation via gh CLI and sub-issue linking via PyGithub GraphQL.
+Handles issue creation via the REST API and sub-issue linking via GraphQL.
 Includes retry logic and error handling.
 """
 
+import os
+import random
 import subprocess
+import threading
 import time
-import re
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, Optional, List, Dict, Any, Set, Tuple, TypeVar, Union
 import logging
 
-from github import Github, GithubException
+import requests
+from github import Auth, Github, GithubException
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # Optional HTTP/2 transport, requests is the fallback
+    httpx = None
+
+from .utils import json_dumps, json_loads
 
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# Keep-alive connections per host; sized above the issue creation concurrency
+DEFAULT_POOL_SIZE = 20
+
+# Aliased addSubIssue mutations sent per GraphQL request
+LINK_BATCH_SIZE = 50
+
+# How long fetched milestones and labels are reused
+CACHE_TTL_SECONDS = 60.0
+
+# Allowed clock difference with GitHub when a create retry looks for an issue
+# the failed attempt created (only issues created after the first attempt match)
+CREATE_CLOCK_SKEW_SECONDS = 5
+
+# Retry policy for transient failures
+LINK_RETRY_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 30.0
+BACKOFF_JITTER = 0.5
+
+# Minimum spacing between mutating requests (issue creation, sub-issue links),
+# across all threads; GitHub's secondary rate limits expect serial writes ~1s apart
+MIN_WRITE_INTERVAL_SECONDS = 1.0
+
+# Longest wait honoured for Retry-After / rate limit resets; beyond it, fail
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+T = TypeVar("T")
+
+# Network failures worth retrying, for whichever HTTP library is in use
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.TransportError,)
+
+# Environment variables checked for a token before asking gh
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+
+# How long a token read from 'gh auth token' is reused across clients
+TOKEN_CACHE_TTL_SECONDS = 300.0
+
+# (fetched_at, token) from the last 'gh auth token' call
+_token_cache: Optional[Tuple[float, str]] = None
+
 
 class GitHubClientError(Exception):
     """Custom exception for GitHub operations."""
@@ -23,13 +79,140 @@ class GitHubClientError(Exception):
     pass
 
 
+class _TransientError(Exception):
+    """A failure worth retrying (timeouts, 5xx, rate limits)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _backoff(
+    attempt: int,
+    base: float,
+    cap: float = MAX_BACKOFF_SECONDS,
+    jitter: float = BACKOFF_JITTER,
+) -> float:
+    """
+    Exponential backoff delay with random jitter.
+
+    Jitter keeps concurrent workers from retrying in lockstep.
+
+    Args:
+        attempt: Zero-based attempt number
+        base: Initial delay in seconds
+        cap: Maximum delay before jitter
+        jitter: Maximum extra fraction of the delay
+
+    Returns:
+        Delay in seconds
+    """
+    return min(cap, base * (2**attempt)) * (1 + random.uniform(0, jitter))
+
+
+def _retry_after_seconds(response: Any) -> Optional[float]:
+    """
+    Read how long GitHub asked us to wait before retrying.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Delay in seconds from Retry-After or an exhausted rate limit's
+        reset time, or None if the response gives no hint
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset:
+            try:
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                return None
+
+    return None
+
+
+def _get_token() -> str:
+    """
+    Get a GitHub token, avoiding the gh subprocess where possible.
+
+    Uses GH_TOKEN or GITHUB_TOKEN when set, then a token cached from an
+    earlier 'gh auth token' call, and only then runs gh.
+
+    Returns:
+        GitHub token
+
+    Raises:
+        GitHubClientError: If no token can be obtained
+    """
+    global _token_cache
+
+    for var in TOKEN_ENV_VARS:
+        token = os.environ.get(var)
+        if token:
+            return token
+
+    if _token_cache is not None and time.monotonic() - _token_cache[0] < TOKEN_CACHE_TTL_SECONDS:
+        return _token_cache[1]
+
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise GitHubClientError(
+            f"Failed to get GitHub token. Is 'gh' CLI authenticated?\n{e.stderr}"
+        )
+    except FileNotFoundError:
+        raise GitHubClientError("'gh' CLI not found. Please install GitHub CLI.")
+
+    token = result.stdout.strip()
+    _token_cache = (time.monotonic(), token)
+    return token
+
+
+def _raise_for_transient(response: Any) -> None:
+    """
+    Raise _TransientError if a response is worth retrying.
+
+    429, 5xx and rate-limited 403 responses are transient; any other
+    status is left for the caller to handle.
+
+    Args:
+        response: HTTP response
+
+    Raises:
+        _TransientError: If the request should be retried
+    """
+    status = response.status_code
+    retry_after = _retry_after_seconds(response)
+
+    rate_limited = status == 403 and (
+        retry_after is not None or "rate limit" in response.text.lower()
+    )
+    if status == 429 or status >= 500 or rate_limited:
+        raise _TransientError(f"HTTP {status}: {response.text[:200]}", retry_after)
+
+
 class GitHubClient:
     """
     Wrapper for GitHub operations.
 
     Uses hybrid approach:
-    - gh CLI for issue creation (faster)
-    - PyGithub for GraphQL operations (sub-issue linking)
+    - REST API over a pooled session for issue creation and lookups
+    - Aliased GraphQL mutations on the same session for sub-issue linking
+    - PyGithub for creating milestones and labels and the user lookup
     """
 
     def __init__(
@@ -38,6 +221,8 @@ class GitHubClient:
         retry_attempts: int = 3,
         retry_backoff_seconds: int = 5,
         timeout_seconds: int = 30,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http2: bool = False,
     ):
         """
         Initialize GitHub client.
@@ -46,89 +231,392 @@ class GitHubClient:
             repository: GitHub repository in format 'owner/repo'
             retry_attempts: Number of retry attempts for failed operations
             retry_backoff_seconds: Initial backoff delay (exponential)
-            timeout_seconds: Timeout for subprocess calls
+            timeout_seconds: Timeout for subprocess calls and API requests
+            pool_size: Maximum number of pooled keep-alive connections
+            http2: Send direct API calls over HTTP/2 (needs httpx[http2])
         """
         self.repository = repository
         self.retry_attempts = retry_attempts
         self.retry_backoff_seconds = retry_backoff_seconds
         self.timeout_seconds = timeout_seconds
+        self.pool_size = pool_size
+        self.http2 = http2
+
+        # Lazily resolved lookups; caches hold (fetched_at, items)
+        self._milestone_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._label_cache: Optional[Tuple[float, List[str]]] = None
+        self._login: Optional[str] = None
+
+        # Issue numbers returned by create_issue, never matched on retry
+        self._created_numbers: Set[int] = set()
+
+        # Monotonic time of the last mutating request, shared by all threads
+        self._write_lock = threading.Lock()
+        self._last_write = float("-inf")
 
         # Initialize PyGithub with gh CLI token
+        self._bearer_token: Optional[str] = None
         self.github = self._init_github()
-        self.repo = self.github.get_repo(repository)
+        # Lazy: no request until a PyGithub-only operation needs it
+        self.repo = self.github.withLazy(True).get_repo(repository)
+
+        # Pooled keep-alive session for direct API calls
+        self.session = self._init_session()
 
     def _init_github(self) -> Github:
         """
         Initialize PyGithub using gh CLI authentication.
 
+        A GH_TOKEN or GITHUB_TOKEN environment variable takes precedence
+        over the gh CLI token.
+
         Returns:
             Authenticated Github instance
 
         Raises:
             GitHubClientError: If authentication fails
         """
-        try:
-            # Get token from gh CLI
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=True,
-            )
-            token = result.stdout.strip()
-            return Github(token)
-        except subprocess.CalledProcessError as e:
-            raise GitHubClientError(
-                f"Failed to get GitHub token. Is 'gh' CLI authenticated?\n{e.stderr}"
+        token = _get_token()
+        self._bearer_token = token
+
+        # Share keep-alive connections across PyGithub calls and fetch
+        # list endpoints in as few pages as possible
+        return Github(
+            auth=Auth.Token(token),
+            timeout=self.timeout_seconds,
+            per_page=100,
+            pool_size=self.pool_size,
+        )
+
+    def _init_session(self) -> Union[requests.Session, "httpx.Client"]:
+        """
+        Create an authenticated HTTP session with connection pooling.
+
+        Reuses TCP/TLS connections across calls. With http2 enabled and
+        httpx[http2] installed, concurrent requests are multiplexed over
+        one connection instead. Retries are handled by _retry_with_backoff,
+        not by the transport.
+
+        Returns:
+            Configured requests session or httpx client
+        """
+        headers = {
+            "Authorization": f"Bearer {self._bearer_token}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+        }
+
+        if self.http2:
+            if httpx is None:
+                logger.warning("http2 requested but httpx is not installed, using HTTP/1.1")
+            else:
+                try:
+                    return httpx.Client(
+                        http2=True,
+                        headers=headers,
+                        limits=httpx.Limits(
+                            max_connections=self.pool_size,
+                            max_keepalive_connections=self.pool_size,
+                        ),
+                        timeout=self.timeout_seconds,
+                    )
+                except ImportError:
+                    logger.warning("http2 requested but h2 is not installed, using HTTP/1.1")
+
+        session = requests.Session()
+        session.headers.update(headers)
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Send one HTTP request on the session, without retries.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Encoded JSON body, if any
+            params: Query string parameters
+
+        Returns:
+            HTTP response (requests or httpx, same interface)
+        """
+        if isinstance(self.session, requests.Session):
+            return self.session.request(
+                method, url, data=body, params=params, timeout=self.timeout_seconds
             )
-        except FileNotFoundError:
-            raise GitHubClientError("'gh' CLI not found. Please install GitHub CLI.")
+        return self.session.request(
+            method, url, content=body, params=params, timeout=self.timeout_seconds
+        )
+
+    def _pace_write(self) -> None:
+        """
+        Wait until a mutating request may be sent.
+
+        Holds a lock while waiting so concurrent workers send their writes
+        one at a time, at least MIN_WRITE_INTERVAL_SECONDS apart.
+        """
+        with self._write_lock:
+            wait = self._last_write + MIN_WRITE_INTERVAL_SECONDS - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_write = time.monotonic()
 
-    def _run_gh_command(self, args: List[str]) -> str:
+    def _retry_with_backoff(
+        self,
+        operation: Callable[[], T],
+        description: str,
+        attempts: Optional[int] = None,
+    ) -> T:
         """
-        Run gh CLI command with retry logic.
+        Run an operation, retrying transient failures.
+
+        Waits for the delay GitHub asked for plus random jitter when given,
+        otherwise uses jittered exponential backoff. A requested delay longer than
+        MAX_RETRY_AFTER_SECONDS fails instead of blocking the worker. Any
+        other exception (a permanent failure) is raised immediately.
 
         Args:
-            args: Command arguments
+            operation: Callable performing one attempt
+            description: What is being attempted, for log messages
+            attempts: Maximum attempts (defaults to retry_attempts)
 
         Returns:
-            Command output
+            The operation's return value
 
         Raises:
-            GitHubClientError: If command fails after all retries
+            GitHubClientError: If every attempt fails transiently, or GitHub
+                asks to wait longer than MAX_RETRY_AFTER_SECONDS
         """
-        for attempt in range(self.retry_attempts):
+        attempts = attempts or self.retry_attempts
+        error: Exception = GitHubClientError("no attempts made")
+
+        for attempt in range(attempts):
             try:
-                result = subprocess.run(
-                    ["gh"] + args,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    check=True,
+                return operation()
+            except (_TransientError, *_TRANSPORT_ERRORS) as e:
+                error = e
+                retry_after = getattr(e, "retry_after", None)
+
+            logger.warning(f"{description} failed (attempt {attempt + 1}/{attempts}): {error}")
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS:
+                resets_at = datetime.now(timezone.utc) + timedelta(seconds=retry_after)
+                raise GitHubClientError(
+                    f"{description} rate limited until {resets_at:%Y-%m-%d %H:%M:%S} UTC "
+                    f"(in {retry_after:.0f}s): {error}"
                 )
-                return result.stdout.strip()
-            except subprocess.CalledProcessError as e:
-                logger.warning(
-                    f"gh command failed (attempt {attempt + 1}/{self.retry_attempts}): {e.stderr}"
-                )
-                if attempt < self.retry_attempts - 1:
-                    sleep_time = self.retry_backoff_seconds * (2**attempt)
-                    logger.debug(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
-                else:
-                    raise GitHubClientError(f"gh command failed: {e.stderr}")
-            except subprocess.TimeoutExpired:
-                logger.warning(
-                    f"gh command timed out (attempt {attempt + 1}/{self.retry_attempts})"
-                )
-                if attempt < self.retry_attempts - 1:
-                    sleep_time = self.retry_backoff_seconds * (2**attempt)
-                    time.sleep(sleep_time)
+            if attempt < attempts - 1:
+                if retry_after is not None:
+                    # Workers rate limited together shouldn't all wake at once
+                    sleep_time = retry_after + random.uniform(0, self.retry_backoff_seconds)
                 else:
-                    raise GitHubClientError("gh command timed out")
+                    sleep_time = _backoff(attempt, self.retry_backoff_seconds)
+                logger.debug(f"Retrying in {sleep_time:.1f} seconds...")
+                time.sleep(sleep_time)
+
+        raise GitHubClientError(f"{description} failed: {error}")
+
+    def _rest_request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Send a REST API request with retry logic.
+
+        Connection errors, timeouts, rate limits and 5xx responses are
+        retried. Any other response is returned for the caller to check.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. '/repos/owner/repo/issues') or full URL
+            body: Encoded JSON body, if any
+            params: Query string parameters
+
+        Returns:
+            HTTP response
+
+        Raises:
+            GitHubClientError: If the request still fails after all retries
+        """
+        url = path if path.startswith(GITHUB_API_URL) else f"{GITHUB_API_URL}{path}"
+
+        def send() -> Any:
+            response = self._send(method, url, body, params)
+            _raise_for_transient(response)
+            return response
+
+        return self._retry_with_backoff(send, f"GitHub API {method} {path}")
 
-        raise GitHubClientError("gh command failed after all retries")
+    def _paginate(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every item of a paginated REST list endpoint.
+
+        Fetches 100 items per page and follows the Link rel="next" header.
+
+        Args:
+            path: API path of the list endpoint
+            params: Extra query string parameters
+
+        Yields:
+            Items from each page, in order
+
+        Raises:
+            GitHubClientError: If a page cannot be fetched
+        """
+        url: Optional[str] = path
+        page_params: Optional[Dict[str, Any]] = {"per_page": 100, **(params or {})}
+
+        while url:
+            response = self._rest_request("GET", url, params=page_params)
+            if response.status_code >= 400:
+                raise GitHubClientError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            yield from json_loads(response.content)
+
+            # The next link already carries the query string
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            page_params = None
+
+    def _graphql(
+        self, query: str, variables: Dict[str, Any], allow_partial: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute a GraphQL mutation with retry logic.
+
+        Every attempt waits for the shared write pacer. Transient failures
+        (including RATE_LIMITED errors) are retried up to LINK_RETRY_ATTEMPTS
+        times; other errors fail immediately.
+
+        Args:
+            query: GraphQL document
+            variables: Query variables
+            allow_partial: Accept a response with errors if it also has data
+
+        Returns:
+            Parsed response body
+
+        Raises:
+            GitHubClientError: If the request fails
+        """
+
+        def send() -> Dict[str, Any]:
+            self._pace_write()
+            response = self._send(
+                "POST", GRAPHQL_URL, json_dumps({"query": query, "variables": variables})
+            )
+            _raise_for_transient(response)
+            if response.status_code >= 400:
+                raise GitHubClientError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            result = json_loads(response.content)
+            errors = result.get("errors")
+            if errors:
+                if any(error.get("type") == "RATE_LIMITED" for error in errors):
+                    raise _TransientError(f"GraphQL rate limited: {errors}")
+                if not (allow_partial and result.get("data")):
+                    raise GitHubClientError(f"GraphQL errors: {errors}")
+            return result
+
+        return self._retry_with_backoff(send, "GraphQL request", attempts=LINK_RETRY_ATTEMPTS)
+
+    def _get_login(self) -> str:
+        """Get the authenticated user's login (looked up once per client)."""
+        if self._login is None:
+            try:
+                self._login = self.github.get_user().login
+            except GithubException as e:
+                raise GitHubClientError(f"Failed to get authenticated user: {e}")
+        return self._login
+
+    def _resolve_assignees(self, assignees: List[str]) -> List[str]:
+        """Replace gh's '@me' shorthand with the authenticated user's login."""
+        if "@me" not in assignees:
+            return assignees
+
+        login = self._get_login()
+        return [login if a == "@me" else a for a in assignees]
+
+    def _find_recent_issue(
+        self, payload: Dict[str, Any], since: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find an issue created since a given time that matches a create payload.
+
+        Used before retrying a create, in case the failed attempt reached
+        GitHub and only the response was lost. Title, body, milestone and
+        labels must all match, and the issue must be newer than the first
+        attempt, so issues from earlier runs are never picked up.
+
+        Args:
+            payload: Issue creation payload sent by the failed attempt
+            since: When the first attempt was sent (minus clock skew)
+
+        Returns:
+            Dictionary with issue_number, issue_url and node_id, or None
+        """
+        since_text = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params: Dict[str, Any] = {
+            "state": "all",
+            "sort": "created",
+            "direction": "desc",
+            "since": since_text,
+            "per_page": 20,
+        }
+        try:
+            params["creator"] = self._get_login()
+        except GitHubClientError as e:
+            # e.g. GitHub App installation tokens have no user login
+            logger.warning(
+                f"Could not resolve the authenticated login ({e}); "
+                f"checking recent issues from any creator"
+            )
+
+        response = self._rest_request("GET", f"/repos/{self.repository}/issues", params=params)
+        if response.status_code >= 400:
+            logger.warning(
+                f"Could not list recent issues (HTTP {response.status_code}): "
+                f"{response.text[:200]}"
+            )
+            return None
+
+        body = payload.get("body") or ""
+        milestone = payload.get("milestone")
+        labels = set(payload.get("labels", ()))
+
+        for item in json_loads(response.content):
+            if (
+                "pull_request" not in item
+                and item["number"] not in self._created_numbers
+                # 'since' filters on update time; creation must be after it too
+                and item["created_at"] >= since_text
+                and item["title"] == payload["title"]
+                and (item.get("body") or "") == body
+                and (item.get("milestone") or {}).get("number") == milestone
+                and {label["name"] for label in item.get("labels", ())} == labels
+            ):
+                return {
+                    "issue_number": item["number"],
+                    "issue_url": item["html_url"],
+                    "node_id": item["node_id"],
+                }
+        return None
 
     def create_issue(
         self,
@@ -139,7 +627,14 @@ class GitHubClient:
         assignees: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
-        Create a GitHub issue using gh CLI.
+        Create a GitHub issue with a single REST API call.
+
+        The response already contains the node_id, so no follow-up lookup
+        is needed. Before each retry, recent issues are checked for one the
+        failed attempt may have created, so retries don't duplicate issues.
+        Each POST waits for the shared write pacer, as PyGithub's own write
+        throttling did, so retries can't burst. A 4xx rejection (validation,
+        auth, missing repository) is permanent and fails immediately.
 
         Args:
             title: Issue title
@@ -157,55 +652,72 @@ class GitHubClient:
         Raises:
             GitHubClientError: If issue creation fails
         """
-        args = [
-            "issue",
-            "create",
-            "--repo",
-            self.repository,
-            "--title",
-            title,
-        ]
+        payload: Dict[str, Any] = {"title": title}
 
         if body:
-            args.extend(["--body", body])
+            payload["body"] = body
 
         if milestone:
-            args.extend(["--milestone", milestone])
+            number = self.resolve_milestone_title_to_number(milestone)
+            if number is None:
+                raise GitHubClientError(f"Milestone '{milestone}' not found")
+            payload["milestone"] = number
 
         if labels:
-            for label in labels:
-                args.extend(["--label", label])
+            payload["labels"] = list(labels)
 
         if assignees:
-            for assignee in assignees:
-                args.extend(["--assignee", assignee])
-
-        # Create issue
-        output = self._run_gh_command(args)
-
-        # Parse issue URL from output (gh outputs the URL)
-        # Example: https://github.com/owner/repo/issues/123
-        match = re.search(r'https://github\.com/[^/]+/[^/]+/issues/(\d+)', output)
-        if not match:
-            raise GitHubClientError(f"Could not parse issue number from gh output: {output}")
+            payload["assignees"] = self._resolve_assignees(list(assignees))
+
+        url = f"{GITHUB_API_URL}/repos/{self.repository}/issues"
+        encoded = json_dumps(payload)
+        since: Optional[datetime] = None
+
+        def attempt() -> Dict[str, Any]:
+            nonlocal since
+
+            # A timed-out attempt may still have created the issue
+            if since is not None:
+                try:
+                    existing = self._find_recent_issue(payload, since)
+                except GitHubClientError as e:
+                    logger.warning(f"Could not check for an earlier attempt's issue: {e}")
+                    existing = None
+                if existing:
+                    logger.info(
+                        f"Found issue #{existing['issue_number']} from an earlier attempt, "
+                        f"not creating a duplicate: {title}"
+                    )
+                    return existing
+            else:
+                since = datetime.now(timezone.utc) - timedelta(
+                    seconds=CREATE_CLOCK_SKEW_SECONDS
+                )
 
-        issue_number = int(match.group(1))
-        issue_url = match.group(0)
+            self._pace_write()
+            response = self._send("POST", url, encoded)
+            _raise_for_transient(response)
 
-        # Get node_id via PyGithub (needed for GraphQL)
-        try:
-            issue = self.repo.get_issue(issue_number)
-            node_id = issue.raw_data['node_id']
-        except GithubException as e:
-            raise GitHubClientError(f"Failed to get issue node_id: {e}")
+            # Anything else in 4xx is permanent; resending the same request won't help
+            if response.status_code >= 400:
+                raise GitHubClientError(
+                    f"Issue creation rejected (HTTP {response.status_code}): "
+                    f"{response.text[:200]}"
+                )
 
-        logger.info(f"Created issue #{issue_number}: {title}")
+            data = json_loads(response.content)
+            logger.info(f"Created issue #{data['number']}: {title}")
+            return {
+                "issue_number": data["number"],
+                "issue_url": data["html_url"],
+                "node_id": data["node_id"],
+            }
 
-        return {
-            "issue_number": issue_number,
-            "issue_url": issue_url,
-            "node_id": node_id,
-        }
+        result = self._retry_with_backoff(
+            attempt, f"GitHub API POST /repos/{self.repository}/issues"
+        )
+        self._created_numbers.add(result["issue_number"])
+        return result
 
     def link_sub_issue(self, parent_node_id: str, child_node_id: str) -> bool:
         """
@@ -231,61 +743,114 @@ class GitHubClient:
         }
         """
 
-        for attempt in range(5):  # More retries for linking
-            try:
-                # Execute GraphQL mutation
-                headers = {
-                    "Authorization": f"Bearer {self.github._Github__requester.auth.token}",
-                }
+        try:
+            self._graphql(mutation, {"parentId": parent_node_id, "childId": child_node_id})
+        except GitHubClientError as e:
+            raise GitHubClientError(f"Failed to link sub-issue: {e}")
 
-                # Use PyGithub's requester to execute GraphQL
-                result = self.github._Github__requester.requestJsonAndCheck(
-                    "POST",
-                    "/graphql",
-                    input={
-                        "query": mutation,
-                        "variables": {"parentId": parent_node_id, "childId": child_node_id},
-                    },
-                )
+        logger.debug(f"Linked sub-issue: {child_node_id} → {parent_node_id}")
+        return True
 
-                if "errors" in result:
-                    raise GitHubClientError(f"GraphQL errors: {result['errors']}")
+    def link_sub_issues_bulk(
+        self, parent_node_id: str, child_node_ids: List[str]
+    ) -> List[str]:
+        """
+        Link several children to one parent with aliased GraphQL mutations.
 
-                logger.debug(f"Linked sub-issue: {child_node_id} → {parent_node_id}")
-                return True
+        Children are sent in batches of LINK_BATCH_SIZE, one request per
+        batch. Individual links can fail while the rest of the batch
+        succeeds; those failures are logged and left out of the result.
 
-            except Exception as e:
-                logger.warning(
-                    f"Sub-issue linking failed (attempt {attempt + 1}/5): {e}"
-                )
-                if attempt < 4:
-                    sleep_time = self.retry_backoff_seconds * (2**attempt)
-                    time.sleep(sleep_time)
-                else:
-                    raise GitHubClientError(f"Failed to link sub-issue: {e}")
+        Args:
+            parent_node_id: GraphQL node ID of parent issue
+            child_node_ids: GraphQL node IDs of child issues
+
+        Returns:
+            Node IDs of the children that were linked
+
+        Raises:
+            GitHubClientError: If a batch request fails after all retries
+        """
+        linked: List[str] = []
+
+        for start in range(0, len(child_node_ids), LINK_BATCH_SIZE):
+            batch = child_node_ids[start:start + LINK_BATCH_SIZE]
+
+            params = "".join(f", $c{i}: ID!" for i in range(len(batch)))
+            fields = "\n".join(
+                f"  a{i}: addSubIssue(input: {{issueId: $parent, subIssueId: $c{i}}}) "
+                f"{{ issue {{ id }} }}"
+                for i in range(len(batch))
+            )
+            mutation = f"mutation($parent: ID!{params}) {{\n{fields}\n}}"
+
+            variables = {"parent": parent_node_id}
+            variables.update({f"c{i}": node_id for i, node_id in enumerate(batch)})
+
+            try:
+                result = self._graphql(mutation, variables, allow_partial=True)
+            except GitHubClientError as e:
+                raise GitHubClientError(f"Failed to link sub-issues: {e}")
+
+            data = result.get("data") or {}
+            for error in result.get("errors", []):
+                logger.warning(f"Sub-issue linking error: {error.get('message', error)}")
+
+            for i, node_id in enumerate(batch):
+                if data.get(f"a{i}"):
+                    linked.append(node_id)
+                    logger.debug(f"Linked sub-issue: {node_id} → {parent_node_id}")
+
+        return linked
 
-        return False
+    def _cache_fresh(self, cache: Optional[Tuple[float, Any]]) -> bool:
+        """Check whether a (fetched_at, items) cache entry is within its TTL."""
+        return cache is not None and time.monotonic() - cache[0] < CACHE_TTL_SECONDS
 
     def get_milestones(self) -> List[Dict[str, Any]]:
         """
         Get all milestones for the repository.
 
+        Results are cached for CACHE_TTL_SECONDS.
+
         Returns:
             List of milestone dictionaries with 'title', 'number', 'description'
         """
+        if self._cache_fresh(self._milestone_cache):
+            return list(self._milestone_cache[1])
+
         try:
-            milestones = self.repo.get_milestones(state="all")
-            return [
+            result = [
                 {
-                    "title": m.title,
-                    "number": m.number,
-                    "description": m.description or "",
+                    "title": m["title"],
+                    "number": m["number"],
+                    "description": m.get("description") or "",
                 }
-                for m in milestones
+                for m in self._paginate(
+                    f"/repos/{self.repository}/milestones", {"state": "all"}
+                )
             ]
-        except GithubException as e:
+        except GitHubClientError as e:
             raise GitHubClientError(f"Failed to get milestones: {e}")
 
+        self._milestone_cache = (time.monotonic(), result)
+        return list(result)
+
+    def resolve_milestone_title_to_number(self, title: str) -> Optional[int]:
+        """
+        Look up a milestone's number by title.
+
+        Args:
+            title: Milestone title
+
+        Returns:
+            Milestone number, or None if no milestone has this title
+        """
+        for milestone in self.get_milestones():
+            if milestone["title"] == title:
+                return milestone["number"]
+        return None
+
     def create_milestone(self, title: str, description: Optional[str] = None) -> None:
         """
         Create a new milestone.
@@ -298,24 +863,39 @@ class GitHubClient:
             GitHubClientError: If milestone creation fails
         """
         try:
-            self.repo.create_milestone(title, description=description)
+            milestone = self.repo.create_milestone(title, description=description or "")
             logger.info(f"Created milestone: {title}")
         except GithubException as e:
             raise GitHubClientError(f"Failed to create milestone '{title}': {e}")
 
+        # Write through so the next lookup doesn't refetch
+        if self._milestone_cache is not None:
+            self._milestone_cache[1].append(
+                {"title": title, "number": milestone.number, "description": description or ""}
+            )
+
     def get_labels(self) -> List[str]:
         """
         Get all labels for the repository.
 
+        Results are cached for CACHE_TTL_SECONDS.
+
         Returns:
             List of label names
         """
+        if self._cache_fresh(self._label_cache):
+            return list(self._label_cache[1])
+
         try:
-            labels = self.repo.get_labels()
-            return [label.name for label in labels]
-        except GithubException as e:
+            result = [
+                label["name"] for label in self._paginate(f"/repos/{self.repository}/labels")
+            ]
+        except GitHubClientError as e:
             raise GitHubClientError(f"Failed to get labels: {e}")
 
+        self._label_cache = (time.monotonic(), result)
+        return list(result)
+
     def create_label(
         self, name: str, color: str = "cccccc", description: Optional[str] = None
     ) -> None:
@@ -336,18 +916,29 @@ class GitHubClient:
         except GithubException as e:
             raise GitHubClientError(f"Failed to create label '{name}': {e}")
 
+        # Write through so the next lookup doesn't refetch
+        if self._label_cache is not None:
+            self._label_cache[1].append(name)
+
     def verify_issue_exists(self, issue_number: int) -> bool:
         """
         Check if an issue exists.
 
+        Sends a HEAD request, since only the status code matters, and falls
+        back to GET if the endpoint rejects HEAD.
+
         Args:
             issue_number: GitHub issue number
 
         Returns:
             True if issue exists, False otherwise
         """
+        path = f"/repos/{self.repository}/issues/{issue_number}"
+
         try:
-            self.repo.get_issue(issue_number)
-            return True
-        except GithubException:
+            response = self._rest_request("HEAD", path)
+            if response.status_code == 405:
+                response = self._rest_request("GET", path)
+        except GitHubClientError:
             return False
+        return response.status_code == 200
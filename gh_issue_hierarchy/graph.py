@@ -5,7 +5,11 @@ Handles parent-child relationships, topological sorting,
 and tree traversal operations.
 """
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+# Visit states for the iterative DFS in topological_sort
+_IN_PROGRESS = 1
+_DONE = 2
 
 
 class IssueGraph:
@@ -23,23 +27,40 @@ class IssueGraph:
         Args:
             issues: List of issue dictionaries with 'id' and optional 'parent_id'
         """
-        self.issues = {issue['id']: issue for issue in issues}
+        self.issues: Dict[str, Dict[str, Any]] = {}
         self.children_map: Dict[Optional[str], List[str]] = {}
-        self._build_adjacency_list()
+        self.depths: Dict[str, int] = {}
+        self._index_issues(issues)
 
-    def _build_adjacency_list(self) -> None:
-        """Build parent→children mapping."""
+    def _index_issues(self, issues: Iterable[Dict[str, Any]]) -> None:
+        """
+        Build the issue index, parent→children mapping and depths.
+
+        The index and mapping are filled in a single pass over the input.
+
+        Args:
+            issues: Issue dictionaries with unique 'id' values
+        """
+        self.issues = {}
         self.children_map = {}
+        issue_index = self.issues
+        children_map = self.children_map
 
-        for issue_id, issue in self.issues.items():
-            parent_id = issue.get('parent_id')
+        for issue in issues:
+            issue_id = issue['id']
+            issue_index[issue_id] = issue
+            children_map.setdefault(issue.get('parent_id'), []).append(issue_id)
 
-            # Initialize parent's children list if not exists
-            if parent_id not in self.children_map:
-                self.children_map[parent_id] = []
+        # One BFS from the roots; issues it can't reach are orphans or in cycles
+        self.depths = {
+            issue_id: depth
+            for depth, level in enumerate(self.level_order())
+            for issue_id in level
+        }
 
-            # Add this issue as a child of its parent
-            self.children_map[parent_id].append(issue_id)
+    def _build_adjacency_list(self) -> None:
+        """Rebuild parent→children mapping and depths from self.issues."""
+        self._index_issues(list(self.issues.values()))
 
     def get_children(self, issue_id: Optional[str]) -> List[str]:
         """
@@ -66,8 +87,9 @@ class IssueGraph:
         """
         Sort issues topologically (parents before children).
 
-        Uses depth-first search to ensure parent issues are always
-        created before their children.
+        Uses an iterative depth-first search to ensure parent issues are
+        always created before their children, without hitting the recursion
+        limit on deep hierarchies.
 
         Returns:
             List of issue IDs in topological order
@@ -76,43 +98,75 @@ class IssueGraph:
             ValueError: If circular dependencies are detected
         """
         sorted_issues: List[str] = []
-        visited: Set[str] = set()
-        in_progress: Set[str] = set()
-
-        def dfs(issue_id: Optional[str]) -> None:
-            """Depth-first traversal."""
-            if issue_id is None:
-                # Process root issues
-                for root_id in self.get_root_issues():
-                    if root_id not in visited:
-                        dfs(root_id)
-                return
-
-            if issue_id in in_progress:
-                raise ValueError(f"Circular dependency detected involving issue '{issue_id}'")
+        state: Dict[str, int] = {}
 
-            if issue_id in visited:
-                return
+        # Reversed pushes keep the same visit order as a recursive DFS
+        stack = [(root_id, False) for root_id in reversed(self.get_root_issues())]
+        children = self.children_map.get
 
-            in_progress.add(issue_id)
+        while stack:
+            issue_id, processed = stack.pop()
 
-            # Visit children first (depth-first)
-            for child_id in self.get_children(issue_id):
-                dfs(child_id)
+            if processed:
+                # All children finished
+                state[issue_id] = _DONE
+                sorted_issues.append(issue_id)
+                continue
 
-            in_progress.remove(issue_id)
-            visited.add(issue_id)
-            sorted_issues.append(issue_id)
+            issue_state = state.get(issue_id)
+            if issue_state == _DONE:
+                continue
+            if issue_state == _IN_PROGRESS:
+                raise ValueError(f"Circular dependency detected involving issue '{issue_id}'")
 
-        # Start DFS from root (None represents root level)
-        dfs(None)
+            state[issue_id] = _IN_PROGRESS
+            stack.append((issue_id, True))
+
+            # Visit children first (depth-first)
+            for child_id in reversed(children(issue_id, ())):
+                stack.append((child_id, False))
 
         # Reverse to get parent-before-children order
         return list(reversed(sorted_issues))
 
+    def level_order(self) -> Iterator[List[str]]:
+        """
+        Yield issues level by level, breadth-first from the roots.
+
+        Issues in the same level never depend on each other, so a level can
+        be processed in parallel once every earlier level is done.
+
+        Yields:
+            Lists of issue IDs sharing the same depth (roots first)
+        """
+        level = list(self.get_root_issues())
+        children = self.children_map.get
+
+        while level:
+            yield level
+            level = [child_id for issue_id in level for child_id in children(issue_id, ())]
+
+    def topological_levels(self) -> List[List[str]]:
+        """
+        Group issues into levels by depth (parents before children).
+
+        Returns:
+            List of levels, each a list of issue IDs (roots first)
+        """
+        return list(self.level_order())
+
+    def compute_all_depths(self) -> Dict[str, int]:
+        """
+        Get the depth of every issue reachable from a root.
+
+        Returns:
+            Dictionary mapping issue ID to depth (0 for root issues)
+        """
+        return dict(self.depths)
+
     def get_depth(self, issue_id: str) -> int:
         """
-        Calculate the depth of an issue in the tree.
+        Get the depth of an issue in the tree.
 
         Root issues have depth 0, their children have depth 1, etc.
 
@@ -122,22 +176,28 @@ class IssueGraph:
         Returns:
             Depth of the issue (0 for root issues)
         """
-        depth = 0
-        current_id = issue_id
+        return self.depths.get(issue_id, 0)
 
-        while True:
-            issue = self.issues.get(current_id)
-            if not issue:
-                break
+    def iter_descendants(self, issue_id: str) -> Iterator[str]:
+        """
+        Lazily iterate over all descendants of an issue.
 
-            parent_id = issue.get('parent_id')
-            if parent_id is None:
-                break
+        Yields in depth-first pre-order (a child, then its subtree, then the
+        next child), without recursion.
+
+        Args:
+            issue_id: ID of the issue
 
-            depth += 1
-            current_id = parent_id
+        Yields:
+            Descendant issue IDs
+        """
+        children = self.children_map.get
+        stack = list(reversed(children(issue_id, ())))
 
-        return depth
+        while stack:
+            current_id = stack.pop()
+            yield current_id
+            stack.extend(reversed(children(current_id, ())))
 
     def get_all_descendants(self, issue_id: str) -> List[str]:
         """
@@ -149,15 +209,7 @@ class IssueGraph:
         Returns:
             List of all descendant issue IDs
         """
-        descendants: List[str] = []
-
-        def collect_descendants(current_id: str) -> None:
-            for child_id in self.get_children(current_id):
-                descendants.append(child_id)
-                collect_descendants(child_id)
-
-        collect_descendants(issue_id)
-        return descendants
+        return list(self.iter_descendants(issue_id))
 
     def validate_references(self) -> None:
         """
@@ -167,8 +219,43 @@ class IssueGraph:
             ValueError: If any parent_id references a non-existent issue
         """
         for issue_id, issue in self.issues.items():
+            # Anything reachable from a root has a valid parent chain
+            if issue_id in self.depths:
+                continue
+
             parent_id = issue.get('parent_id')
             if parent_id is not None and parent_id not in self.issues:
                 raise ValueError(
                     f"Issue '{issue_id}' references non-existent parent '{parent_id}'"
                 )
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """
+        Find a circular parent_id chain, if there is one.
+
+        Only issues the level-order walk cannot reach are checked; each one's
+        parent chain is followed until it ends, joins a chain already checked,
+        or returns to itself.
+
+        Returns:
+            Issue IDs forming the cycle (child first), or None if acyclic
+        """
+        checked = set(self.depths)
+
+        for start_id in self.issues:
+            if start_id in checked:
+                continue
+
+            # Insertion-ordered, so the cycle can be sliced out of the walk
+            path: Dict[str, None] = {}
+            issue_id: Optional[str] = start_id
+            while issue_id in self.issues and issue_id not in checked and issue_id not in path:
+                path[issue_id] = None
+                issue_id = self.issues[issue_id].get('parent_id')
+
+            if issue_id in path:
+                walked = list(path)
+                return walked[walked.index(issue_id):]
+            checked.update(path)
+
+        return None
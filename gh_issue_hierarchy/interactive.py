@@ -6,15 +6,16 @@ Handles missing milestones and labels with Rich-based menus and prompts.
 
 from typing import Optional, List, Dict, Any
 
-from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.panel import Panel
 
+from ._console import get_console
 from .github_client import GitHubClient
 
 
-console = Console()
+# Longest milestone description shown in the selection table
+DESCRIPTION_PREVIEW_CHARS = 50
 
 
 def prompt_for_milestone(
@@ -35,6 +36,8 @@ def prompt_for_milestone(
     Returns:
         Selected milestone name, or None to skip
     """
+    console = get_console()
+
     console.print(
         f"\n[yellow]Milestone '{milestone_name}' does not exist.[/yellow]"
     )
@@ -81,15 +84,22 @@ def prompt_for_milestone(
 
             # Display milestones in a table
             table = Table(title="Available Milestones")
-            table.add_column("#", style="cyan")
+            table.add_column("#", style="cyan", justify="right", no_wrap=True)
             table.add_column("Title", style="green")
-            table.add_column("Description")
+            table.add_column(
+                "Description",
+                no_wrap=True,
+                overflow="ellipsis",
+                max_width=DESCRIPTION_PREVIEW_CHARS,
+            )
 
             for idx, milestone in enumerate(milestones, 1):
                 table.add_row(
                     str(idx),
                     milestone["title"],
-                    milestone["description"][:50] if milestone["description"] else "",
+                    # Plain slice: long first words (URLs, paths) still show; the column
+                    # adds an ellipsis when the terminal squeezes it further
+                    milestone["description"][:DESCRIPTION_PREVIEW_CHARS],
                 )
 
             console.print(table)
@@ -142,6 +152,8 @@ def prompt_for_labels(
     Returns:
         List of label names to use (may be empty)
     """
+    console = get_console()
+
     console.print(
         f"\n[yellow]The following labels do not exist:[/yellow]"
     )
@@ -199,6 +211,8 @@ def display_summary_panel(stats: Dict[str, Any]) -> None:
     Args:
         stats: Dictionary with statistics
     """
+    console = get_console()
+
     content = []
 
     if "created" in stats:
@@ -5,10 +5,83 @@ Manages runs and created issues in a local database to enable
 idempotent operations and resume functionality.
 """
 
+import atexit
+import functools
 import sqlite3
-from datetime import datetime
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, Iterable, List, Tuple, TypeVar
+
+
+# Stay below SQLite's default limit of 999 bound parameters per statement
+MAX_SQL_PARAMS = 900
+
+# Page cache (negative PRAGMA value means KiB) and memory-mapped I/O size
+CACHE_SIZE_KIB = 20000
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Compiled statements kept per connection (Python's default is 128)
+CACHED_STATEMENTS = 256
+
+# UTC timestamp generated by SQLite, ISO 8601 so stored values sort chronologically
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+# Hot statements, kept as constants so the statement cache key is stable
+SQL_INSERT_RUN = f"""
+    INSERT INTO runs (run_id, input_file, input_file_hash, repository, started_at, status)
+    VALUES (?, ?, ?, ?, {SQL_NOW}, 'in_progress')
+"""
+SQL_SELECT_RUN_BY_HASH = (
+    "SELECT * FROM runs WHERE input_file_hash = ? ORDER BY started_at DESC LIMIT 1"
+)
+SQL_SELECT_RUN = "SELECT * FROM runs WHERE run_id = ?"
+SQL_SELECT_CREATED_ISSUE = "SELECT * FROM created_issues WHERE run_id = ? AND local_id = ?"
+SQL_SELECT_BY_FINGERPRINT = "SELECT * FROM created_issues WHERE fingerprint = ? LIMIT 1"
+# Columns bound by both the single-row and multi-row created_issues INSERTs
+CREATED_ISSUE_COLUMNS = (
+    "run_id",
+    "local_id",
+    "github_issue_number",
+    "github_issue_url",
+    "github_node_id",
+    "title",
+    "fingerprint",
+    "parent_id",
+)
+SQL_CREATED_ISSUE_ROW = f"({', '.join('?' * len(CREATED_ISSUE_COLUMNS))}, {SQL_NOW})"
+SQL_INSERT_CREATED_ISSUES = (
+    f"INSERT INTO created_issues ({', '.join(CREATED_ISSUE_COLUMNS)}, created_at) VALUES "
+)
+SQL_INSERT_CREATED_ISSUE = SQL_INSERT_CREATED_ISSUES + SQL_CREATED_ISSUE_ROW
+SQL_UPDATE_LINK = f"""
+    UPDATE created_issues
+    SET parent_issue_number = ?, linked_at = {SQL_NOW}
+    WHERE run_id = ? AND local_id = ?
+"""
+SQL_RUN_STATS = """
+    SELECT COUNT(*) AS total,
+           SUM(CASE WHEN linked_at IS NOT NULL THEN 1 ELSE 0 END) AS linked
+    FROM created_issues
+    WHERE run_id = ?
+"""
+SQL_UPDATE_RUN_STATUS = f"""
+    UPDATE runs
+    SET status = ?, completed_at = {SQL_NOW}
+    WHERE run_id = ?
+"""
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _locked(method: F) -> F:
+    """Serialize access to the shared connection across threads."""
+
+    @functools.wraps(method)
+    def wrapper(self: "StateManager", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
 
 
 class StateManager:
@@ -29,30 +102,46 @@ class StateManager:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn: Optional[sqlite3.Connection] = None
+        # Set for instances handed out by get_state_manager()
+        self._shared = False
+        self._lock = threading.RLock()
         self._init_database()
 
     def _init_database(self) -> None:
         """Create database schema if it doesn't exist."""
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Shared with worker threads; every access goes through self._lock
+        self.conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=CACHED_STATEMENTS
+        )
         self.conn.row_factory = sqlite3.Row
 
+        # Cheaper commits: WAL journal, fsync only at checkpoints.
+        # In-memory databases have no journal file to switch.
+        if str(self.db_path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        self.conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+
         cursor = self.conn.cursor()
 
         # Create runs table
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS runs (
                 run_id TEXT PRIMARY KEY,
                 input_file TEXT NOT NULL,
                 input_file_hash TEXT NOT NULL,
                 repository TEXT NOT NULL,
-                started_at TEXT NOT NULL,
+                started_at TEXT NOT NULL DEFAULT ({SQL_NOW}),
                 completed_at TEXT,
                 status TEXT NOT NULL CHECK(status IN ('in_progress', 'completed', 'failed'))
             )
         """)
 
         # Create created_issues table
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS created_issues (
                 run_id TEXT NOT NULL,
                 local_id TEXT NOT NULL,
@@ -60,11 +149,11 @@ class StateManager:
                 github_issue_url TEXT NOT NULL,
                 github_node_id TEXT NOT NULL,
                 title TEXT NOT NULL,
-                fingerprint TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,  -- blake2b-128 (32 hex) or legacy sha256 (64 hex)
                 parent_id TEXT,
                 parent_issue_number INTEGER,
                 linked_at TEXT,
-                created_at TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT ({SQL_NOW}),
                 PRIMARY KEY (run_id, local_id),
                 FOREIGN KEY (run_id) REFERENCES runs(run_id)
             )
@@ -76,18 +165,35 @@ class StateManager:
             ON created_issues(fingerprint)
         """)
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_local_id
-            ON created_issues(local_id)
-        """)
+        # local_id lookups always include run_id, which the primary key covers
+        cursor.execute("DROP INDEX IF EXISTS idx_local_id")
 
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_run_status
             ON runs(status)
         """)
 
+        # Covers the per-run queries (stats, listing, delete) without table lookups
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_created_issues_run'"
+        )
+        new_run_index = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_created_issues_run
+            ON created_issues(run_id, linked_at)
+        """)
+
+        self.conn.commit()
+
+        # Give the query planner statistics for the new index, once
+        if new_run_index:
+            self.conn.execute("ANALYZE")
+
+    def _commit(self) -> None:
+        """Commit pending writes."""
         self.conn.commit()
 
+    @_locked
     def create_run(
         self, run_id: str, input_file: str, input_file_hash: str, repository: str
     ) -> None:
@@ -100,17 +206,14 @@ class StateManager:
             input_file_hash: SHA256 hash of input file
             repository: GitHub repository (owner/repo)
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO runs (run_id, input_file, input_file_hash, repository, started_at, status)
-            VALUES (?, ?, ?, ?, ?, 'in_progress')
-            """,
-            (run_id, input_file, input_file_hash, repository, datetime.utcnow().isoformat()),
+        self.conn.execute(
+            SQL_INSERT_RUN,
+            (run_id, input_file, input_file_hash, repository),
         )
-        self.conn.commit()
+        self._commit()
 
-    def get_run_by_hash(self, input_file_hash: str) -> Optional[Dict[str, Any]]:
+    @_locked
+    def get_run_by_hash(self, input_file_hash: str) -> Optional[sqlite3.Row]:
         """
         Find existing run by input file hash.
 
@@ -118,17 +221,13 @@ class StateManager:
             input_file_hash: SHA256 hash of input file
 
         Returns:
-            Run record as dictionary, or None if not found
+            Run record (sqlite3.Row, indexable by column name), or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM runs WHERE input_file_hash = ? ORDER BY started_at DESC LIMIT 1",
-            (input_file_hash,),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        row = self.conn.execute(SQL_SELECT_RUN_BY_HASH, (input_file_hash,)).fetchone()
+        return row
 
-    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+    @_locked
+    def get_run(self, run_id: str) -> Optional[sqlite3.Row]:
         """
         Get run by ID.
 
@@ -136,14 +235,13 @@ class StateManager:
             run_id: Run identifier
 
         Returns:
-            Run record as dictionary, or None if not found
+            Run record (sqlite3.Row, indexable by column name), or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        row = self.conn.execute(SQL_SELECT_RUN, (run_id,)).fetchone()
+        return row
 
-    def get_created_issue(self, run_id: str, local_id: str) -> Optional[Dict[str, Any]]:
+    @_locked
+    def get_created_issue(self, run_id: str, local_id: str) -> Optional[sqlite3.Row]:
         """
         Lookup issue by local_id in a specific run.
 
@@ -152,17 +250,13 @@ class StateManager:
             local_id: Local issue identifier
 
         Returns:
-            Issue record as dictionary, or None if not found
+            Issue record (sqlite3.Row, indexable by column name), or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM created_issues WHERE run_id = ? AND local_id = ?",
-            (run_id, local_id),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        row = self.conn.execute(SQL_SELECT_CREATED_ISSUE, (run_id, local_id)).fetchone()
+        return row
 
-    def find_by_fingerprint(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+    @_locked
+    def find_by_fingerprint(self, fingerprint: str) -> Optional[sqlite3.Row]:
         """
         Find issue by fingerprint across all runs.
 
@@ -170,16 +264,38 @@ class StateManager:
             fingerprint: Issue fingerprint hash
 
         Returns:
-            Issue record as dictionary, or None if not found
+            Issue record (sqlite3.Row, indexable by column name), or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM created_issues WHERE fingerprint = ? LIMIT 1",
-            (fingerprint,),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        row = self.conn.execute(SQL_SELECT_BY_FINGERPRINT, (fingerprint,)).fetchone()
+        return row
+
+    @_locked
+    def find_by_fingerprints(self, fingerprints: Iterable[str]) -> Dict[str, sqlite3.Row]:
+        """
+        Find issues matching any of the given fingerprints across all runs.
+
+        Args:
+            fingerprints: Issue fingerprint hashes
 
+        Returns:
+            Dictionary mapping each matched fingerprint to one issue record
+        """
+        unique = list(dict.fromkeys(fingerprints))
+        matches: Dict[str, sqlite3.Row] = {}
+
+        for start in range(0, len(unique), MAX_SQL_PARAMS):
+            chunk = unique[start:start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT * FROM created_issues WHERE fingerprint IN ({placeholders})",
+                chunk,
+            )
+            for row in rows:
+                matches.setdefault(row["fingerprint"], row)
+
+        return matches
+
+    @_locked
     def record_created_issue(
         self,
         run_id: str,
@@ -204,14 +320,8 @@ class StateManager:
             fingerprint: Issue fingerprint
             parent_id: Parent issue local_id (if any)
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO created_issues
-            (run_id, local_id, github_issue_number, github_issue_url, github_node_id,
-             title, fingerprint, parent_id, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        self.conn.execute(
+            SQL_INSERT_CREATED_ISSUE,
             (
                 run_id,
                 local_id,
@@ -221,11 +331,36 @@ class StateManager:
                 title,
                 fingerprint,
                 parent_id,
-                datetime.utcnow().isoformat(),
             ),
         )
-        self.conn.commit()
+        self._commit()
+
+    @_locked
+    def record_created_issues(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Save several newly created issues with multi-row INSERTs.
+
+        Args:
+            records: Dictionaries with the keyword arguments of
+                record_created_issue()
+        """
+        rows = [tuple(record.get(column) for column in CREATED_ISSUE_COLUMNS) for record in records]
+        if not rows:
+            return
+
+        # One parameter per column; keep each statement under the parameter limit
+        rows_per_statement = MAX_SQL_PARAMS // len(CREATED_ISSUE_COLUMNS)
+
+        for start in range(0, len(rows), rows_per_statement):
+            chunk = rows[start:start + rows_per_statement]
+            values = ",".join([SQL_CREATED_ISSUE_ROW] * len(chunk))
+            self.conn.execute(
+                SQL_INSERT_CREATED_ISSUES + values,
+                [value for row in chunk for value in row],
+            )
+        self._commit()
 
+    @_locked
     def record_link(self, run_id: str, local_id: str, parent_issue_number: int) -> None:
         """
         Update issue record when sub-issue link is established.
@@ -235,17 +370,48 @@ class StateManager:
             local_id: Local issue identifier
             parent_issue_number: GitHub issue number of parent
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE created_issues
-            SET parent_issue_number = ?, linked_at = ?
-            WHERE run_id = ? AND local_id = ?
-            """,
-            (parent_issue_number, datetime.utcnow().isoformat(), run_id, local_id),
+        self.conn.execute(
+            SQL_UPDATE_LINK,
+            (parent_issue_number, run_id, local_id),
         )
-        self.conn.commit()
+        self._commit()
+
+    @_locked
+    def record_links(self, run_id: str, links: Iterable[Tuple[str, int]]) -> None:
+        """
+        Record several established sub-issue links with batched UPDATEs.
+
+        Args:
+            run_id: Run identifier
+            links: (local_id, parent_issue_number) pairs
+        """
+        pairs = list(links)
+        if not pairs:
+            return
+
+        # Three parameters per link (CASE pair + IN list) plus run_id
+        links_per_statement = (MAX_SQL_PARAMS - 1) // 3
+
+        for start in range(0, len(pairs), links_per_statement):
+            chunk = pairs[start:start + links_per_statement]
+            cases = " ".join(["WHEN ? THEN ?"] * len(chunk))
+            placeholders = ",".join("?" * len(chunk))
+            self.conn.execute(
+                f"""
+                UPDATE created_issues
+                SET parent_issue_number = CASE local_id {cases} END,
+                    linked_at = {SQL_NOW}
+                WHERE run_id = ? AND local_id IN ({placeholders})
+                """,
+                [
+                    *(value for pair in chunk for value in pair),
+                    run_id,
+                    *(local_id for local_id, _ in chunk),
+                ],
+            )
+        self._commit()
 
+    @_locked
     def mark_run_complete(self, run_id: str, status: str = "completed") -> None:
         """
         Mark run as complete or failed.
@@ -254,17 +420,10 @@ class StateManager:
             run_id: Run identifier
             status: Final status ('completed' or 'failed')
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE runs
-            SET status = ?, completed_at = ?
-            WHERE run_id = ?
-            """,
-            (status, datetime.utcnow().isoformat(), run_id),
-        )
-        self.conn.commit()
+        self.conn.execute(SQL_UPDATE_RUN_STATUS, (status, run_id))
+        self._commit()
 
+    @_locked
     def get_run_stats(self, run_id: str) -> Dict[str, int]:
         """
         Calculate statistics for a run.
@@ -275,35 +434,25 @@ class StateManager:
         Returns:
             Dictionary with counts: total, linked, unlinked
         """
-        cursor = self.conn.cursor()
-
-        # Total issues created
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM created_issues WHERE run_id = ?", (run_id,)
-        )
-        total = cursor.fetchone()["count"]
-
-        # Linked issues
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM created_issues WHERE run_id = ? AND linked_at IS NOT NULL",
-            (run_id,),
-        )
-        linked = cursor.fetchone()["count"]
+        # Total and linked issues in one pass; SUM is NULL when no rows match
+        row = self.conn.execute(SQL_RUN_STATS, (run_id,)).fetchone()
+        total = row["total"]
+        linked = row["linked"] or 0
 
         return {"total": total, "linked": linked, "unlinked": total - linked}
 
-    def list_all_runs(self) -> List[Dict[str, Any]]:
+    @_locked
+    def list_all_runs(self) -> List[sqlite3.Row]:
         """
         List all runs in the database.
 
         Returns:
             List of run records
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM runs ORDER BY started_at DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        return self.conn.execute("SELECT * FROM runs ORDER BY started_at DESC").fetchall()
 
-    def get_created_issues_for_run(self, run_id: str) -> List[Dict[str, Any]]:
+    @_locked
+    def get_created_issues_for_run(self, run_id: str) -> List[sqlite3.Row]:
         """
         Get all created issues for a specific run.
 
@@ -313,13 +462,12 @@ class StateManager:
         Returns:
             List of issue records
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM created_issues WHERE run_id = ? ORDER BY created_at",
+        return self.conn.execute(
+            "SELECT * FROM created_issues WHERE run_id = ? ORDER BY created_at, rowid",
             (run_id,),
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        ).fetchall()
 
+    @_locked
     def delete_run(self, run_id: str) -> None:
         """
         Delete a run and all its created issues.
@@ -327,11 +475,11 @@ class StateManager:
         Args:
             run_id: Run identifier
         """
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM created_issues WHERE run_id = ?", (run_id,))
-        cursor.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
-        self.conn.commit()
+        self.conn.execute("DELETE FROM created_issues WHERE run_id = ?", (run_id,))
+        self.conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+        self._commit()
 
+    @_locked
     def close(self) -> None:
         """Close database connection."""
         if self.conn:
@@ -343,5 +491,45 @@ class StateManager:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Context manager exit."""
-        self.close()
+        """Context manager exit. Shared instances stay open for reuse."""
+        if not self._shared:
+            self.close()
+
+
+# One long-lived manager per database file, so repeated operations don't
+# reopen the database and its WAL/SHM files
+_shared_managers: Dict[str, StateManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_state_manager(db_path: Path) -> StateManager:
+    """
+    Get the shared state manager for a database file.
+
+    Reuses the open connection from an earlier call; a manager that was
+    closed explicitly is replaced with a fresh one.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Shared StateManager instance
+    """
+    key = str(db_path) if str(db_path) == ":memory:" else str(Path(db_path).resolve())
+
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None or manager.conn is None:
+            manager = StateManager(Path(db_path))
+            manager._shared = True
+            _shared_managers[key] = manager
+        return manager
+
+
+@atexit.register
+def close_state_managers() -> None:
+    """Close every shared state manager."""
+    with _shared_lock:
+        for manager in _shared_managers.values():
+            manager.close()
+        _shared_managers.clear()
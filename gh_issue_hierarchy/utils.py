@@ -5,9 +5,22 @@ Utility functions and helpers.
 import hashlib
 import json
 import logging
+import mmap
+import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+# owner/repo: exactly one slash, no whitespace in either part
+REPOSITORY_PATTERN = re.compile(r"[^/\s]+/[^/\s]+")
 
 
 def compute_file_hash(file_path: Path) -> str:
@@ -20,15 +33,69 @@ def compute_file_hash(file_path: Path) -> str:
     Returns:
         Hexadecimal hash string
     """
-    hash_obj = hashlib.sha256()
-
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hash_obj.update(chunk)
+        # Python 3.11+: reads into a reusable buffer and hashes without the GIL
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        hash_obj = hashlib.sha256()
+        # mmap rejects empty files; their digest is that of no data
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                hash_obj.update(view)
 
     return hash_obj.hexdigest()
 
 
+def compute_bytes_hash(data: bytes) -> str:
+    """
+    Compute SHA256 hash of an in-memory buffer.
+
+    Produces the same digest as compute_file_hash() for the file's contents.
+
+    Args:
+        data: Raw bytes
+
+    Returns:
+        Hexadecimal hash string
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error
+            type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
 def generate_run_id() -> str:
     """
     Generate a unique run ID based on timestamp.
@@ -52,15 +119,11 @@ def format_duration(seconds: float) -> str:
     if seconds < 60:
         return f"{seconds:.0f}s"
 
-    minutes = int(seconds // 60)
-    remaining_seconds = int(seconds % 60)
-
+    minutes, remaining_seconds = divmod(int(seconds), 60)
     if minutes < 60:
         return f"{minutes}m {remaining_seconds}s"
 
-    hours = int(minutes // 60)
-    remaining_minutes = int(minutes % 60)
-
+    hours, remaining_minutes = divmod(minutes, 60)
     return f"{hours}h {remaining_minutes}m {remaining_seconds}s"
 
 
@@ -73,11 +136,10 @@ def merge_labels(defaults: List[str], issue_labels: List[str]) -> List[str]:
         issue_labels: Issue-specific labels
 
     Returns:
-        Combined list of unique labels
+        Combined list of unique labels, defaults first, in order of first appearance
     """
-    # Use set to remove duplicates, then convert back to list
-    combined = set(defaults) | set(issue_labels)
-    return sorted(list(combined))
+    # dict keeps insertion order, so one pass drops duplicates without sorting
+    return list(dict.fromkeys([*defaults, *issue_labels]))
 
 
 def apply_defaults(
@@ -95,27 +157,46 @@ def apply_defaults(
     Returns:
         Issue with defaults applied
     """
-    if not defaults:
-        return issue
+    return make_defaults_applier(defaults)(issue)
 
-    result = issue.copy()
 
-    # Apply simple defaults (if not present in issue)
-    if 'milestone' not in result and 'milestone' in defaults:
-        result['milestone'] = defaults['milestone']
+def make_defaults_applier(
+    defaults: Optional[Dict[str, Any]]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that applies the same defaults to many issues.
 
-    if 'assignees' not in result and 'assignees' in defaults:
-        result['assignees'] = defaults['assignees']
+    Equivalent to apply_defaults(issue, defaults) for each issue, with the
+    per-defaults work (label de-duplication, the empty check) done once.
 
-    if 'due_date' not in result and 'due_date' in defaults:
-        result['due_date'] = defaults['due_date']
+    Args:
+        defaults: Default values dictionary
 
-    # Labels are additive (merge)
-    default_labels = defaults.get('labels', [])
-    issue_labels = result.get('labels', [])
-    result['labels'] = merge_labels(default_labels, issue_labels)
+    Returns:
+        Function taking an issue dictionary and returning it with defaults applied
+    """
+    if not defaults:
+        return lambda issue: issue
+
+    # Order-preserving set of default labels, merged into per issue
+    default_labels = dict.fromkeys(defaults.get('labels', ()))
+
+    def apply(issue: Dict[str, Any]) -> Dict[str, Any]:
+        # Issue fields win over defaults in a single C-level merge
+        result = {**defaults, **issue}
+
+        # Labels are additive, defaults first (same order as merge_labels)
+        issue_labels = issue.get('labels')
+        if issue_labels:
+            labels = default_labels.copy()
+            labels.update(dict.fromkeys(issue_labels))
+            result['labels'] = list(labels)
+        else:
+            result['labels'] = list(default_labels)
 
-    return result
+        return result
+
+    return apply
 
 
 def setup_logging(
@@ -169,12 +250,25 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     """
     Load configuration from JSON file.
 
+    The parsed file is cached per process until its modification time
+    changes; each call gets its own copy.
+
     Args:
         config_path: Path to config file
 
     Returns:
         Configuration dictionary with defaults
     """
+    try:
+        mtime_ns: Optional[int] = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return dict(_load_config_cached(str(config_path), mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(config_path: str, mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """Load a config file merged over defaults; mtime_ns None means missing."""
     defaults = {
         "state_db_path": ".state/state.db",
         "log_directory": "logs/",
@@ -183,17 +277,19 @@ def load_config(config_path: Path) -> Dict[str, Any]:
         "retry_backoff_seconds": 5,
         "github_api_timeout_seconds": 30,
         "enable_color": True,
+        "fingerprint_algorithm": "blake2b",
+        "github_concurrency": 4,
+        "http2": False,
     }
 
-    if not config_path.exists():
+    if mtime_ns is None:
         return defaults
 
     try:
-        with open(config_path, 'r') as f:
-            user_config = json.load(f)
-            # Merge with defaults
-            defaults.update(user_config)
-            return defaults
+        user_config = json_loads(Path(config_path).read_bytes())
+        # Merge with defaults
+        defaults.update(user_config)
+        return defaults
     except Exception:
         # Return defaults if config loading fails
         return defaults
@@ -209,5 +305,4 @@ def validate_repository_format(repository: str) -> bool:
     Returns:
         True if valid format
     """
-    parts = repository.split('/')
-    return len(parts) == 2 and all(part.strip() for part in parts)
+    return REPOSITORY_PATTERN.fullmatch(repository) is not None
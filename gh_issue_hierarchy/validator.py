@@ -6,12 +6,20 @@ validation (cycles, orphaned references, duplicates).
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 
 import jsonschema
+from jsonschema.exceptions import best_match
 
 from .graph import IssueGraph
+from .utils import json_loads
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional speedup, jsonschema alone is the fallback
+    fastjsonschema = None
 
 
 class ValidationError(Exception):
@@ -34,14 +42,53 @@ def load_schema(schema_path: Path) -> Dict[str, Any]:
         ValidationError: If schema file cannot be loaded
     """
     try:
-        with open(schema_path, 'r') as f:
-            return json.load(f)
+        return json_loads(schema_path.read_bytes())
     except FileNotFoundError:
         raise ValidationError(f"Schema file not found: {schema_path}")
     except json.JSONDecodeError as e:
         raise ValidationError(f"Invalid JSON in schema file: {e}")
 
 
+def load_input_bytes(input_path: Path) -> bytes:
+    """
+    Read the raw contents of an input file.
+
+    Lets callers hash and parse the file from a single read.
+
+    Args:
+        input_path: Path to the input JSON file
+
+    Returns:
+        File contents
+
+    Raises:
+        ValidationError: If input file cannot be read
+    """
+    try:
+        return input_path.read_bytes()
+    except FileNotFoundError:
+        raise ValidationError(f"Input file not found: {input_path}")
+
+
+def parse_input(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse raw input file contents.
+
+    Args:
+        raw: Input file contents
+
+    Returns:
+        Parsed input data
+
+    Raises:
+        ValidationError: If the contents are not valid JSON
+    """
+    try:
+        return json_loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValidationError(f"Invalid JSON in input file: {e}")
+
+
 def load_input_file(input_path: Path) -> Dict[str, Any]:
     """
     Load input JSON file.
@@ -55,36 +102,142 @@ def load_input_file(input_path: Path) -> Dict[str, Any]:
     Raises:
         ValidationError: If input file cannot be loaded
     """
+    return parse_input(load_input_bytes(input_path))
+
+
+def compile_schema(schema: Dict[str, Any]) -> Any:
+    """
+    Check a JSON schema and build a reusable validator for it.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        jsonschema validator instance for the schema's declared draft
+
+    Raises:
+        ValidationError: If the schema itself is invalid
+    """
+    validator_cls = jsonschema.validators.validator_for(schema)
+    try:
+        validator_cls.check_schema(schema)
+    except jsonschema.SchemaError as e:
+        raise ValidationError(f"Invalid schema: {e.message}")
+    return validator_cls(schema)
+
+
+@lru_cache(maxsize=None)
+def _loaded_schema(schema_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load the schema at a path; cached until the file changes."""
+    return load_schema(Path(schema_path))
+
+
+@lru_cache(maxsize=None)
+def _compiled_schema(schema_path: str, mtime_ns: int) -> Any:
+    """Compile the schema at a path; cached until the file changes."""
+    return compile_schema(_loaded_schema(schema_path, mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _fast_schema(schema_path: str, mtime_ns: int) -> Optional[Callable[[Any], Any]]:
+    """Generate fastjsonschema's validation function, or None if unavailable."""
+    if fastjsonschema is None:
+        return None
+    # Checks the schema first so invalid schemas get the usual error
+    _compiled_schema(schema_path, mtime_ns)
     try:
-        with open(input_path, 'r') as f:
-            return json.load(f)
+        return fastjsonschema.compile(_loaded_schema(schema_path, mtime_ns))
+    except fastjsonschema.JsonSchemaDefinitionException:
+        # Schema uses something fastjsonschema doesn't support
+        return None
+
+
+def _schema_mtime(schema_path: Path) -> int:
+    """Get a schema file's modification time, used as the cache key."""
+    try:
+        return schema_path.stat().st_mtime_ns
     except FileNotFoundError:
-        raise ValidationError(f"Input file not found: {input_path}")
-    except json.JSONDecodeError as e:
-        raise ValidationError(f"Invalid JSON in input file: {e}")
+        raise ValidationError(f"Schema file not found: {schema_path}")
 
 
-def validate_against_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
+def get_schema_validator(schema_path: Path) -> Any:
     """
-    Validate data against JSON schema.
+    Get the compiled validator for a schema file.
+
+    The schema is loaded and compiled once per process and reused until
+    the file's modification time changes.
+
+    Args:
+        schema_path: Path to the JSON schema file
+
+    Returns:
+        jsonschema validator instance
+
+    Raises:
+        ValidationError: If the schema cannot be loaded or is invalid
+    """
+    return _compiled_schema(str(schema_path), _schema_mtime(schema_path))
+
+
+def validate_with_schema_file(data: Dict[str, Any], schema_path: Path) -> None:
+    """
+    Validate data against a schema file using the cached validators.
+
+    With the optional fastjsonschema package installed, valid data is
+    accepted by its generated code; jsonschema only runs to explain a
+    failure, so error messages are the same either way.
 
     Args:
         data: Input data to validate
-        schema: JSON schema
+        schema_path: Path to the JSON schema file
+
+    Raises:
+        ValidationError: If the schema is unusable or validation fails
+    """
+    mtime_ns = _schema_mtime(schema_path)
+    fast_validate = _fast_schema(str(schema_path), mtime_ns)
+    if fast_validate is not None:
+        try:
+            fast_validate(data)
+            return
+        except fastjsonschema.JsonSchemaValueException:
+            pass
+
+    validate_with_validator(data, _compiled_schema(str(schema_path), mtime_ns))
+
+
+def validate_with_validator(data: Dict[str, Any], validator: Any) -> None:
+    """
+    Validate data with a compiled schema validator.
+
+    Args:
+        data: Input data to validate
+        validator: Validator from compile_schema() or get_schema_validator()
 
     Raises:
         ValidationError: If validation fails with detailed error message
     """
-    try:
-        jsonschema.validate(instance=data, schema=schema)
-    except jsonschema.ValidationError as e:
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
         # Format error message with path information
-        path = ' → '.join(str(p) for p in e.absolute_path) if e.absolute_path else 'root'
+        path = ' → '.join(str(p) for p in error.absolute_path) if error.absolute_path else 'root'
         raise ValidationError(
-            f"Schema validation failed at '{path}': {e.message}"
+            f"Schema validation failed at '{path}': {error.message}"
         )
-    except jsonschema.SchemaError as e:
-        raise ValidationError(f"Invalid schema: {e.message}")
+
+
+def validate_against_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
+    """
+    Validate data against JSON schema.
+
+    Args:
+        data: Input data to validate
+        schema: JSON schema
+
+    Raises:
+        ValidationError: If validation fails with detailed error message
+    """
+    validate_with_validator(data, compile_schema(schema))
 
 
 def validate_unique_ids(issues: List[Dict[str, Any]]) -> None:
@@ -97,19 +250,24 @@ def validate_unique_ids(issues: List[Dict[str, Any]]) -> None:
     Raises:
         ValidationError: If duplicate IDs are found
     """
+    ids = [issue['id'] for issue in issues]
+
+    # Common case: set construction runs in C and no duplicate pass is needed
+    if len(set(ids)) == len(ids):
+        return
+
+    # Rescan only to report every duplicate
     seen_ids: Set[str] = set()
     duplicates: List[str] = []
 
-    for issue in issues:
-        issue_id = issue['id']
+    for issue_id in ids:
         if issue_id in seen_ids:
             duplicates.append(issue_id)
         seen_ids.add(issue_id)
 
-    if duplicates:
-        raise ValidationError(
-            f"Duplicate issue IDs found: {', '.join(duplicates)}"
-        )
+    raise ValidationError(
+        f"Duplicate issue IDs found: {', '.join(duplicates)}"
+    )
 
 
 def validate_parent_references(issues: List[Dict[str, Any]]) -> None:
@@ -123,34 +281,91 @@ def validate_parent_references(issues: List[Dict[str, Any]]) -> None:
         ValidationError: If orphaned parent references are found
     """
     issue_ids = {issue['id'] for issue in issues}
-    orphaned: List[str] = []
+    parent_refs = [
+        (issue['id'], issue['parent_id'])
+        for issue in issues
+        if issue.get('parent_id') is not None
+    ]
+    _check_parent_refs(parent_refs, issue_ids)
+
+
+def _check_parent_refs(parent_refs: List[Tuple[str, str]], issue_ids: Set[str]) -> None:
+    """Raise ValidationError for (issue_id, parent_id) pairs whose parent is missing."""
+    # One set difference; the per-reference scan only runs to build the error
+    missing = {parent_id for _, parent_id in parent_refs} - issue_ids
+    if not missing:
+        return
+
+    orphaned = [
+        f"{issue_id} → {parent_id}"
+        for issue_id, parent_id in parent_refs
+        if parent_id in missing
+    ]
+    raise ValidationError(
+        "Orphaned parent references found:\n  " + "\n  ".join(orphaned)
+    )
 
-    for issue in issues:
-        parent_id = issue.get('parent_id')
-        if parent_id is not None and parent_id not in issue_ids:
-            orphaned.append(f"{issue['id']} → {parent_id}")
 
-    if orphaned:
+def validate_no_circular_dependencies(issues: List[Dict[str, Any]]) -> None:
+    """
+    Validate that there are no circular dependencies in the issue graph.
+
+    Args:
+        issues: List of issue dictionaries
+
+    Raises:
+        ValidationError: If circular dependencies are detected
+    """
+    _check_cycles(IssueGraph(issues))
+
+
+def _check_cycles(graph: IssueGraph) -> None:
+    """Raise ValidationError if the graph contains a parent_id cycle."""
+    cycle = graph.find_cycle()
+    if cycle:
         raise ValidationError(
-            f"Orphaned parent references found:\n  " + "\n  ".join(orphaned)
+            "Circular dependency detected: " + " → ".join([*cycle, cycle[0]])
         )
 
 
-def validate_no_circular_dependencies(issues: List[Dict[str, Any]]) -> None:
+def validate_issue_structure(issues: List[Dict[str, Any]]) -> None:
     """
-    Validate that there are no circular dependencies in the issue graph.
+    Check unique IDs, parent references and cycles in one pass over the issues.
+
+    Equivalent to validate_unique_ids(), validate_parent_references() and
+    validate_no_circular_dependencies() in that order.
 
     Args:
         issues: List of issue dictionaries
 
     Raises:
-        ValidationError: If circular dependencies are detected
+        ValidationError: If any structural check fails
     """
-    try:
-        graph = IssueGraph(issues)
-        graph.topological_sort()
-    except ValueError as e:
-        raise ValidationError(str(e))
+    seen_ids: Set[str] = set()
+    duplicates: List[str] = []
+    parent_refs: List[Tuple[str, str]] = []
+
+    for issue in issues:
+        issue_id = issue['id']
+        if issue_id in seen_ids:
+            duplicates.append(issue_id)
+        seen_ids.add(issue_id)
+
+        parent_id = issue.get('parent_id')
+        if parent_id is not None:
+            parent_refs.append((issue_id, parent_id))
+
+    if duplicates:
+        raise ValidationError(
+            f"Duplicate issue IDs found: {', '.join(duplicates)}"
+        )
+
+    _check_parent_refs(parent_refs, seen_ids)
+
+    # Every parent exists now, so any issue the BFS missed hangs off a cycle
+    graph = IssueGraph(issues)
+    if len(graph.depths) != len(seen_ids):
+        _check_cycles(graph)
 
 
 def validate_input_file(input_path: Path, schema_path: Path) -> Dict[str, Any]:
@@ -173,18 +388,31 @@ def validate_input_file(input_path: Path, schema_path: Path) -> Dict[str, Any]:
     Raises:
         ValidationError: If any validation fails
     """
-    # Load files
-    schema = load_schema(schema_path)
-    data = load_input_file(input_path)
+    return validate_input_data(load_input_file(input_path), schema_path)
+
+
+def validate_input_data(data: Dict[str, Any], schema_path: Path) -> Dict[str, Any]:
+    """
+    Validate already-parsed input data comprehensively.
+
+    Runs the same checks as validate_input_file().
 
-    # Schema validation
-    validate_against_schema(data, schema)
+    Args:
+        data: Parsed input data
+        schema_path: Path to the JSON schema file
+
+    Returns:
+        Validated input data
+
+    Raises:
+        ValidationError: If any validation fails
+    """
+    # Schema validation (compiled schema is cached per process)
+    validate_with_schema_file(data, schema_path)
 
     # Structural validation
     issues = data.get('issues', [])
 
-    validate_unique_ids(issues)
-    validate_parent_references(issues)
-    validate_no_circular_dependencies(issues)
+    validate_issue_structure(issues)
 
     return data